@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 """ADW Apply Learnings Phase - Implement improvements from retrospective."""
 
-import asyncio
 import sys
 from pathlib import Path
 
@@ -11,6 +10,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 from adw_modules.data_types import ADWPhase
 from adw_modules.state import ADWState
 from adw_modules.agent import run_skill, track_error
+from adw_modules.utils import get_agents_dir, run_async
 
 
 async def run_apply_learnings(state: ADWState) -> bool:
@@ -48,6 +48,7 @@ Apply actionable improvements:
 Skip high-risk changes that need manual review.
 """
 
+    state.flush()
     success, output, output_file = await run_skill(
         skill_name="apply-learnings",
         args=apply_prompt,
@@ -99,19 +100,17 @@ def main():
     adw_id = sys.argv[1]
 
     # Load existing state
-    state = ADWState(adw_id=adw_id)
-
-    # Check if state file exists
-    if not state.state_file.exists():
+    state = ADWState.load(adw_id)
+    if state is None:
         print(f"Error: No ADW state found for {adw_id}")
-        print(f"Expected state file: {state.state_file}")
+        print(f"Expected state file: {get_agents_dir(adw_id) / 'adw_state.json'}")
         sys.exit(1)
 
     print(f"\n[ADW Apply Learnings] Starting for {adw_id}")
     print(f"[ADW Apply Learnings] Task: {state.task}")
     print(f"[ADW Apply Learnings] Completed phases: {len(state.data.completed_phases)}")
 
-    success = asyncio.run(run_apply_learnings(state))
+    success = run_async(run_apply_learnings(state))
 
     if not success:
         sys.exit(1)
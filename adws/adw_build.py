@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 """ADW Build Phase - Implements the plan using /build."""
 
-import asyncio
 import sys
 from pathlib import Path
 
@@ -11,7 +10,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 from adw_modules.data_types import ADWPhase
 from adw_modules.state import ADWState
 from adw_modules.agent import run_skill
-from adw_modules.utils import get_project_root
+from adw_modules.utils import get_agents_dir, run_async
 
 
 async def run_build(state: ADWState) -> bool:
@@ -36,21 +35,12 @@ async def run_build(state: ADWState) -> bool:
 
     state.start_phase(ADWPhase.BUILD)
 
-    # Read the spec file to pass to build
-    spec_content = ""
-    spec_path = Path(state.spec)
-    if spec_path.exists():
-        spec_content = spec_path.read_text(encoding='utf-8')
+    # Pass only the spec path; the /build skill reads the full spec itself
+    build_prompt = f"""Build the implementation described in spec file: {state.spec}
 
-    # Run /build skill with spec reference
-    build_prompt = f"""Build the implementation based on the following spec:
-
-Spec file: {state.spec}
-
-{spec_content[:2000]}  # Truncate if very long
-
-Implement all items in the spec completely."""
+Read the spec fully, then implement every item."""
 
+    state.flush()
     success, output, output_file = await run_skill(
         skill_name="build",
         args=build_prompt,
@@ -77,10 +67,37 @@ Implement all items in the spec completely."""
 
 
 def main():
-    """CLI entry point - requires existing state."""
-    print("Build phase requires state from plan phase.")
-    print("Use adw_plan_build_validate.py for full workflow.")
-    sys.exit(1)
+    """CLI entry point - build an existing, already-planned ADW session."""
+    if len(sys.argv) < 2:
+        print("ADW Build: Implement the spec of a planned ADW session")
+        print()
+        print("Usage:")
+        print("  uv run adws/adw_build.py <adw-id>")
+        print("  python adws/adw_build.py <adw-id>")
+        print()
+        print("Examples:")
+        print('  uv run adws/adw_build.py adw_1768194349_2ac26097')
+        print()
+        print("Note: This requires the plan phase to have been run first.")
+        print("      Use adw_plan_build_validate.py for the full workflow.")
+        sys.exit(1)
+
+    adw_id = sys.argv[1]
+
+    # Load existing state
+    state = ADWState.load(adw_id)
+    if state is None:
+        print(f"Error: No ADW state found for {adw_id}")
+        print(f"Expected state file: {get_agents_dir(adw_id) / 'adw_state.json'}")
+        sys.exit(1)
+
+    print(f"\n[ADW Build] Starting build for {adw_id}")
+    print(f"[ADW Build] Task: {state.task}")
+
+    success = run_async(run_build(state))
+
+    if not success:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
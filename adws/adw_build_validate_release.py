@@ -16,6 +16,7 @@ Usage:
 
 import argparse
 import asyncio
+import os
 import sys
 import time
 from pathlib import Path
@@ -25,7 +26,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from adw_modules.data_types import ADWPhase
 from adw_modules.state import ADWState
-from adw_modules.utils import generate_adw_id, format_duration
+from adw_modules.utils import generate_adw_id, format_duration, ensure_directory, run_async
 from adw_build import run_build
 from adw_validate import run_validate
 from adw_release import run_release
@@ -46,26 +47,36 @@ async def run_build_validate_release(
     start_time = time.time()
     adw_id = generate_adw_id()
 
-    # Validate spec exists
+    # Validate spec exists and is readable
     spec_file = Path(spec_path)
-    if not spec_file.exists():
+    try:
+        open(spec_file, "rb").close()
+    except FileNotFoundError:
         print(f"\n[ERROR] Spec file not found: {spec_path}")
         return False
+    except OSError as e:
+        print(f"\n[ERROR] Spec file not readable: {spec_path} ({e.strerror})")
+        return False
+
+    # Re-runs on a spec already in specs/done/ skip the post-validate move
+    needs_move = "specs/todo/" in spec_file.as_posix()
 
-    print("\n" + "=" * 70)
-    print("ADW ORCHESTRATOR: Build -> Validate -> Release (3-Phase)")
-    print("=" * 70)
-    print(f"ADW ID: {adw_id}")
-    print(f"Spec: {spec_path}")
-    print(f"Skip PyPI: {skip_pypi}")
-    print("=" * 70 + "\n")
+    sys.stdout.write("\n" + "\n".join([
+        "=" * 70,
+        "ADW ORCHESTRATOR: Build -> Validate -> Release (3-Phase)",
+        "=" * 70,
+        f"ADW ID: {adw_id}",
+        f"Spec: {spec_path}",
+        f"Skip PyPI: {skip_pypi}",
+        "=" * 70,
+    ]) + "\n\n")
 
     # Create state with existing spec (skip plan phase)
     state = ADWState(adw_id)
     state.set_spec_file(str(spec_file.absolute()))
 
     # Mark plan as already completed (we're using existing spec)
-    state.data.completed_phases.append(ADWPhase.PLAN.value)
+    state.data.completed_phases.add(ADWPhase.PLAN)
 
     # Phase 1: BUILD
     print("\n" + "-" * 50)
@@ -97,14 +108,15 @@ async def run_build_validate_release(
     print("\n[ORCHESTRATOR] Validate complete.")
 
     # Move spec file from todo/ to done/ after successful validation
-    if state.spec:
+    if needs_move and state.spec:
         spec_path_obj = Path(state.spec)
-        if spec_path_obj.exists() and "specs/todo/" in str(spec_path_obj):
-            done_dir = Path("specs/done")
-            done_dir.mkdir(parents=True, exist_ok=True)
-            new_spec_path = done_dir / spec_path_obj.name
-            spec_path_obj.rename(new_spec_path)
-            state.spec = str(new_spec_path)
+        new_spec_path = ensure_directory(Path("specs/done")) / spec_path_obj.name
+        try:
+            await asyncio.to_thread(os.replace, spec_path_obj, new_spec_path)
+        except FileNotFoundError:
+            pass
+        else:
+            state.set_spec_file(str(new_spec_path))
             print(f"\n[ORCHESTRATOR] Moved spec: {spec_path_obj.name} -> specs/done/")
 
     # Phase 3: RELEASE
@@ -123,16 +135,19 @@ async def run_build_validate_release(
     state.mark_completed()
     elapsed = time.time() - start_time
 
-    print("\n" + "=" * 70)
-    print("ADW WORKFLOW COMPLETED SUCCESSFULLY (3-Phase)")
-    print("=" * 70)
-    print(f"ADW ID: {adw_id}")
-    print(f"Duration: {format_duration(elapsed)}")
-    print(f"Phases completed: {len(state.data.completed_phases)}")
-    print(f"State file: agents/{adw_id}/adw_state.json")
+    summary = [
+        "=" * 70,
+        "ADW WORKFLOW COMPLETED SUCCESSFULLY (3-Phase)",
+        "=" * 70,
+        f"ADW ID: {adw_id}",
+        f"Duration: {format_duration(elapsed)}",
+        f"Phases completed: {len(state.data.completed_phases)}",
+        f"State file: agents/{adw_id}/adw_state.json",
+    ]
     if state.spec:
-        print(f"Spec file: {state.spec}")
-    print("=" * 70 + "\n")
+        summary.append(f"Spec file: {state.spec}")
+    summary.append("=" * 70)
+    sys.stdout.write("\n" + "\n".join(summary) + "\n\n")
 
     return True
 
@@ -159,7 +174,7 @@ Examples:
 
     args = parser.parse_args()
 
-    success = asyncio.run(
+    success = run_async(
         run_build_validate_release(args.spec, args.skip_pypi)
     )
 
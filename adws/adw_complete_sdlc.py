@@ -25,28 +25,25 @@ Options:
 """
 
 import argparse
-import asyncio
+import importlib
+import json
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add modules to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+# Phase runners that always run are imported here; optional ones on demand
+from adw_build import run_build
+from adw_modules.agent import drain_cortex_queue, store_in_cortex
 from adw_modules.data_types import ADWPhase
-from adw_modules.utils import generate_adw_id, format_duration
-from adw_modules.agent import store_in_cortex
-
-# Import individual phase runners
+from adw_modules.scheduler import Phase, schedule
+from adw_modules.utils import format_duration, generate_adw_id, run_async
 from adw_plan import run_plan
-from adw_build import run_build
-from adw_validate import run_validate
-from adw_security import run_security
-from adw_security_fix import run_security_fix
 from adw_review import run_review
-from adw_retrospective import run_retrospective
-from adw_apply_learnings import run_apply_learnings
-from adw_release import run_release
+from adw_validate import run_validate
 
 
 async def run_complete_sdlc(
@@ -68,41 +65,138 @@ async def run_complete_sdlc(
     Returns:
         True if all phases successful
     """
+    try:
+        return await _run_sdlc(
+            task_description, skip_security, skip_release, skip_learnings, skip_pypi
+        )
+    finally:
+        # Queued Cortex writes (failure notes included) land on every exit path
+        await drain_cortex_queue()
+
+
+async def _run_sdlc(
+    task_description: str,
+    skip_security: bool,
+    skip_release: bool,
+    skip_learnings: bool,
+    skip_pypi: bool,
+) -> bool:
+    """Run PLAN through RELEASE; the caller drains the Cortex queue."""
     start_time = time.time()
     adw_id = generate_adw_id()
 
-    print("\n" + "=" * 70)
-    print("ADW COMPLETE SDLC ORCHESTRATOR (9 Phases)")
-    print("=" * 70)
-    print(f"ADW ID: {adw_id}")
-    print(f"Task: {task_description}")
-    print(f"Skip Security: {skip_security}")
-    print(f"Skip Learnings: {skip_learnings}")
-    print(f"Skip Release: {skip_release}")
-    print("=" * 70 + "\n")
-
-    # Track phase count for display
-    total_phases = 9
-    if skip_security:
-        total_phases -= 2
-    if skip_learnings:
-        total_phases -= 2
-    if skip_release:
-        total_phases -= 1
-
-    current_phase = 0
-
-    def phase_header(name: str, description: str):
-        nonlocal current_phase
-        current_phase += 1
-        print(f"\n{'-' * 50}")
-        print(f"PHASE {current_phase}/{total_phases}: {name}")
-        print(f"{description}")
-        print(f"{'-' * 50}")
+    sys.stdout.write("\n" + "\n".join([
+        "=" * 70,
+        "ADW COMPLETE SDLC ORCHESTRATOR (9 Phases)",
+        "=" * 70,
+        f"ADW ID: {adw_id}",
+        f"Task: {task_description}",
+        f"Skip Security: {skip_security}",
+        f"Skip Learnings: {skip_learnings}",
+        f"Skip Release: {skip_release}",
+        "=" * 70,
+    ]) + "\n\n")
+
+    # One record per finished phase, written as JSON lines when the run ends
+    events: list[dict] = []
+
+    def record_phase(name: ADWPhase, ok: bool, started: float) -> None:
+        events.append({
+            "event": "phase_done",
+            "name": name.value,
+            "ok": ok,
+            "dur_s": round(time.perf_counter() - started, 3),
+        })
+
+    def write_phase_events() -> None:
+        sys.stdout.write("".join(json.dumps(e) + "\n" for e in events))
+
+    # ===== PHASES 2-9: declared up front as a dependency DAG =====
+    # Independent phases run concurrently once their dependencies finish.
+    # Only read-only phases overlap: the SECURITY audit runs alongside
+    # VALIDATE and REVIEW. REVIEW waits for VALIDATE because both drive the
+    # dashboard and tear down its port. SECURITY-FIX edits code, so it waits
+    # for every read-only phase (SECURITY, VALIDATE and REVIEW) to finish.
+    def sdlc_phase(
+        name: ADWPhase, deps: set, description: str, runner, failure_note: str,
+        blocking: bool = False, **kwargs,
+    ) -> Phase:
+        async def _run(state) -> bool:
+            phase_header(name, description)
+            started = time.perf_counter()
+            success = await runner(state, **kwargs)
+            record_phase(name, success, started)
+            if not success:
+                print(f"\n[ORCHESTRATOR] {failure_note}")
+            return success
+        return Phase(name, deps, _run, blocking)
+
+    phases = [
+        sdlc_phase(ADWPhase.BUILD, set(), "Implementing the spec", run_build,
+                   "Build phase failed. Stopping workflow.", blocking=True),
+        sdlc_phase(ADWPhase.VALIDATE, {ADWPhase.BUILD}, "Visual validation and testing",
+                   run_validate, "Validate phase failed. Continuing with caution."),
+    ]
+
+    if not skip_security:
+        from adw_security import run_security
+        from adw_security_fix import run_security_fix
+
+        phases += [
+            sdlc_phase(ADWPhase.SECURITY, {ADWPhase.BUILD}, "Security vulnerability audit",
+                       run_security, "Security audit failed. Continuing."),
+            sdlc_phase(ADWPhase.SECURITY_FIX,
+                       {ADWPhase.SECURITY, ADWPhase.VALIDATE, ADWPhase.REVIEW},
+                       "Fixing security issues", run_security_fix,
+                       "Security fix phase failed. Continuing."),
+        ]
+
+    phases.append(
+        sdlc_phase(ADWPhase.REVIEW, {ADWPhase.VALIDATE}, "Spec compliance review",
+                   run_review, "Review phase failed. Continuing.")
+    )
+
+    if not skip_learnings:
+        from adw_apply_learnings import run_apply_learnings
+        from adw_retrospective import run_retrospective
+
+        phases += [
+            sdlc_phase(ADWPhase.RETROSPECTIVE, {ADWPhase.REVIEW, ADWPhase.SECURITY_FIX},
+                       "Documenting lessons learned", run_retrospective,
+                       "Retrospective failed. Continuing."),
+            sdlc_phase(ADWPhase.APPLY_LEARNINGS, {ADWPhase.RETROSPECTIVE},
+                       "Implementing improvements", run_apply_learnings,
+                       "Apply learnings failed. Continuing."),
+        ]
+
+    if not skip_release:
+        from adw_release import run_release
+
+        phases.append(
+            sdlc_phase(ADWPhase.RELEASE,
+                       {ADWPhase.REVIEW, ADWPhase.SECURITY_FIX, ADWPhase.APPLY_LEARNINGS},
+                       "Git commit, push, and publish", run_release,
+                       "Release phase failed.", blocking=True, skip_pypi=skip_pypi)
+        )
+
+    # Phase numbers for display are fixed by declaration order
+    numbers = {ADWPhase.PLAN: 1}
+    numbers.update((phase.name, i) for i, phase in enumerate(phases, 2))
+    total_phases = len(numbers)
+
+    def phase_header(name: ADWPhase, description: str):
+        sys.stdout.write(
+            f"\n{'-' * 50}\n"
+            f"PHASE {numbers[name]}/{total_phases}: {name.value.upper()}\n"
+            f"{description}\n"
+            f"{'-' * 50}\n"
+        )
 
     # ===== PHASE 1: PLAN =====
-    phase_header("PLAN", "Creating implementation spec")
+    phase_header(ADWPhase.PLAN, "Creating implementation spec")
+    started = time.perf_counter()
     plan_success, state = await run_plan(task_description, adw_id)
+    record_phase(ADWPhase.PLAN, plan_success, started)
 
     if not plan_success:
         print("\n[ORCHESTRATOR] Plan phase failed. Stopping workflow.")
@@ -112,105 +206,52 @@ async def run_complete_sdlc(
             tags=["adw-failed", "plan", f"adw_{adw_id}"],
             importance=85,
         )
+        write_phase_events()
         return False
 
     print(f"\n[ORCHESTRATOR] Plan complete. Spec: {state.spec}")
 
-    # ===== PHASE 2: BUILD =====
-    phase_header("BUILD", "Implementing the spec")
-    build_success = await run_build(state)
-
-    if not build_success:
-        print("\n[ORCHESTRATOR] Build phase failed. Stopping workflow.")
-        state.mark_failed("Build phase failed")
-        return False
-
-    print("\n[ORCHESTRATOR] Build complete.")
+    def on_phase_complete(name: str, success: bool) -> None:
+        if success:
+            print(f"\n[ORCHESTRATOR] {name.upper()} complete.")
 
-    # ===== PHASE 3: VALIDATE =====
-    phase_header("VALIDATE", "Visual validation and testing")
-    validate_success = await run_validate(state)
+    results = await schedule(phases, state, on_complete=on_phase_complete)
 
-    if not validate_success:
-        print("\n[ORCHESTRATOR] Validate phase failed. Continuing with caution.")
-        # Don't stop - validation failures aren't always fatal
-
-    print("\n[ORCHESTRATOR] Validate complete.")
-
-    # ===== PHASE 4-5: SECURITY (optional) =====
-    if not skip_security:
-        # Phase 4: Security Audit
-        phase_header("SECURITY", "Security vulnerability audit")
-        security_success = await run_security(state)
-
-        if not security_success:
-            print("\n[ORCHESTRATOR] Security audit failed. Continuing.")
-
-        # Phase 5: Security Fix
-        phase_header("SECURITY-FIX", "Fixing security issues")
-        security_fix_success = await run_security_fix(state)
-
-        if not security_fix_success:
-            print("\n[ORCHESTRATOR] Security fix phase failed. Continuing.")
-
-    # ===== PHASE 6: REVIEW =====
-    phase_header("REVIEW", "Spec compliance review")
-    review_success = await run_review(state)
-
-    if not review_success:
-        print("\n[ORCHESTRATOR] Review phase failed. Continuing.")
-
-    # ===== PHASE 7-8: LEARNINGS (optional) =====
-    if not skip_learnings:
-        # Phase 7: Retrospective
-        phase_header("RETROSPECTIVE", "Documenting lessons learned")
-        retro_success = await run_retrospective(state)
-
-        if not retro_success:
-            print("\n[ORCHESTRATOR] Retrospective failed. Continuing.")
-
-        # Phase 8: Apply Learnings
-        phase_header("APPLY-LEARNINGS", "Implementing improvements")
-        apply_success = await run_apply_learnings(state)
-
-        if not apply_success:
-            print("\n[ORCHESTRATOR] Apply learnings failed. Continuing.")
-
-    # ===== PHASE 9: RELEASE (optional) =====
-    if not skip_release:
-        phase_header("RELEASE", "Git commit, push, and publish")
-        release_success = await run_release(state, skip_pypi=skip_pypi)
-
-        if not release_success:
-            print("\n[ORCHESTRATOR] Release phase failed.")
-            state.mark_failed("Release phase failed")
+    for phase in phases:
+        if phase.blocking and results.get(phase.name) is False:
+            state.mark_failed(f"{phase.name.value.capitalize()} phase failed")
+            write_phase_events()
             return False
 
     # All phases complete
     state.mark_completed()
-    elapsed = time.time() - start_time
-
-    print("\n" + "=" * 70)
-    print("ADW COMPLETE SDLC WORKFLOW COMPLETED")
-    print("=" * 70)
-    print(f"ADW ID: {adw_id}")
-    print(f"Duration: {format_duration(elapsed)}")
-    print(f"Phases completed: {len(state.data.completed_phases)}/{total_phases}")
-    print(f"State file: agents/{adw_id}/adw_state.json")
+    duration = format_duration(time.time() - start_time)
+
+    summary = [
+        "=" * 70,
+        "ADW COMPLETE SDLC WORKFLOW COMPLETED",
+        "=" * 70,
+        f"ADW ID: {adw_id}",
+        f"Duration: {duration}",
+        f"Phases completed: {len(state.data.completed_phases)}/{total_phases}",
+        f"State file: agents/{adw_id}/adw_state.json",
+    ]
     if state.spec:
-        print(f"Spec file: {state.spec}")
-    print("=" * 70)
+        summary.append(f"Spec file: {state.spec}")
+    summary.append("=" * 70)
+    sys.stdout.write("\n" + "\n".join(summary) + "\n")
+    write_phase_events()
 
     # Store success in Cortex
     store_in_cortex(
         content=f"""ADW {adw_id} COMPLETED successfully.
 
 Task: {task_description}
-Duration: {format_duration(elapsed)}
+Duration: {duration}
 Phases: {len(state.data.completed_phases)}
 Spec: {state.spec}
 
-Completed phases: {", ".join(p.value for p in state.data.completed_phases)}""",
+Completed phases: {state.completed_phases_text()}""",
         tags=["adw-completed", "success", f"adw_{adw_id}"],
         importance=80,
     )
@@ -219,6 +260,27 @@ Completed phases: {", ".join(p.value for p in state.data.completed_phases)}""",
     return True
 
 
+def preload_phase_modules(
+    skip_security: bool, skip_release: bool, skip_learnings: bool
+) -> None:
+    """Import the optional phase runners this run needs on worker threads.
+
+    Overlaps the module loads instead of paying for them one at a time
+    when each phase first starts.
+    """
+    needed = []
+    if not skip_security:
+        needed += ["adw_security", "adw_security_fix"]
+    if not skip_learnings:
+        needed += ["adw_retrospective", "adw_apply_learnings"]
+    if not skip_release:
+        needed.append("adw_release")
+
+    if needed:
+        with ThreadPoolExecutor(max_workers=4) as ex:
+            list(ex.map(importlib.import_module, needed))
+
+
 def main():
     """CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -278,8 +340,9 @@ Phases:
         sys.exit(1)
 
     task = " ".join(args.task)
+    preload_phase_modules(args.skip_security, args.skip_release, args.skip_learnings)
 
-    success = asyncio.run(
+    success = run_async(
         run_complete_sdlc(
             task_description=task,
             skip_security=args.skip_security,
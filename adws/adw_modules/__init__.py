@@ -10,9 +10,11 @@ This package provides the core building blocks for ADWs:
 from .data_types import ADWPhase, ADWStateData, PhaseResult
 from .state import ADWState
 from .agent import (
+    ADWAgentSession,
     run_claude_code,
     track_error,
     store_in_cortex,
+    drain_cortex_queue,
     MAX_RETRIES,
     MAX_CONSECUTIVE_ERRORS,
 )
@@ -23,9 +25,11 @@ __all__ = [
     "ADWStateData",
     "PhaseResult",
     "ADWState",
+    "ADWAgentSession",
     "run_claude_code",
     "track_error",
     "store_in_cortex",
+    "drain_cortex_queue",
     "MAX_RETRIES",
     "MAX_CONSECUTIVE_ERRORS",
     "generate_adw_id",
@@ -4,12 +4,19 @@ Includes error tracking via Omni-Cortex for retrospective context preservation.
 """
 
 import asyncio
+import dataclasses
+import functools
+import io
 import json
 import os
+import queue
+import random
+import re
 import subprocess
+import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional
 
 from dotenv import load_dotenv
 
@@ -19,6 +26,9 @@ env_file = project_root / ".env"
 if env_file.exists():
     load_dotenv(env_file)
 
+# Environment passed through to the Claude SDK subprocess
+_ADW_ENV: dict[str, str] = {k: os.environ[k] for k in ("ANTHROPIC_API_KEY",) if k in os.environ}
+
 from claude_agent_sdk import (
     ClaudeSDKClient,
     ClaudeAgentOptions,
@@ -44,32 +54,82 @@ MAX_RETRIES = 3  # Maximum attempts for any single fix
 MAX_CONSECUTIVE_ERRORS = 5  # Stop if N errors in a row
 
 
-def store_in_cortex(content: str, tags: list[str], importance: int = 80, memory_type: str = "troubleshooting") -> bool:
-    """Store information in Omni-Cortex for retrospective access.
+def _max_concurrency(default: int = 4) -> int:
+    """Read ADW_MAX_CONCURRENCY, falling back to default if unset or invalid."""
+    value = os.getenv("ADW_MAX_CONCURRENCY", "")
+    try:
+        limit = int(value)
+    except ValueError:
+        if value:
+            print(f"[ADW] Warning: ignoring invalid ADW_MAX_CONCURRENCY={value!r}")
+        return default
+    return limit if limit > 0 else default
+
+
+# SDK call concurrency and transient-error retry
+_API_SEMAPHORE = asyncio.Semaphore(_max_concurrency())
+RETRY_MAX_DELAY = 30  # Seconds
+# Status codes only count next to a status label, so numbers in paths or
+# tool output can't trigger a retry
+_RETRYABLE_ERROR = re.compile(
+    r"(?:status[_ ]?code|error[_ ]code|api error)\W*(?:429|5\d\d)\b|rate[_ ]?limit|overloaded",
+    re.IGNORECASE,
+)
 
-    Uses the cortex CLI to store memories directly, enabling retrospective
-    phases to access build errors and decisions.
+# Default allowed tools for ADW execution
+ALLOWED_TOOLS: tuple[str, ...] = (
+    "Read", "Write", "Edit", "Bash", "Glob", "Grep",
+    "Task", "WebFetch", "WebSearch", "TodoWrite",
+    "Skill", "AskUserQuestion",
+)
 
-    Args:
-        content: The content to remember
-        tags: List of tags for categorization
-        importance: 1-100 importance score
-        memory_type: Type of memory (troubleshooting, decision, etc.)
+# Agent output logging
+JSONL_BUFFER_SIZE = 64 * 1024
+_FLUSH = object()  # Writer-queue marker: flush the file buffer now
+# Piped (non-TTY) echo of agent text is batched up to this many characters;
+# a timer flushes anything left after CONSOLE_FLUSH_INTERVAL seconds
+CONSOLE_FLUSH_CHARS = 4096
+CONSOLE_FLUSH_INTERVAL = 0.25
+
+# Thinking is often most of a transcript and is rarely read back, so it is
+# only logged when ADW_CAPTURE_THINKING=1
+CAPTURE_THINKING = os.getenv("ADW_CAPTURE_THINKING", "0") == "1"
+
+# Output log entry builders, keyed on SDK content block type
+_BLOCK_HANDLERS: dict[type, Callable[[Any, str], dict]] = {
+    TextBlock: lambda b, ts: {"type": "text", "content": b.text, "timestamp": ts},
+    ToolUseBlock: lambda b, ts: {
+        "type": "tool_use", "tool_name": b.name, "tool_input": b.input, "timestamp": ts,
+    },
+}
+if CAPTURE_THINKING:
+    _BLOCK_HANDLERS[ThinkingBlock] = lambda b, ts: {
+        "type": "thinking", "content": b.thinking, "timestamp": ts,
+    }
 
-    Returns:
-        True if stored successfully, False otherwise
-    """
+
+# Background queue for Cortex writes, created lazily inside the running loop
+_cortex_queue: Optional[asyncio.Queue] = None
+_cortex_worker: Optional[asyncio.Task] = None
+
+
+def _cortex_cmd(content: str, tags: list[str], importance: int, memory_type: str) -> list[str]:
+    """Build the cortex CLI command line for storing one memory."""
+    return [
+        "cortex", "remember",
+        "--content", content,
+        "--tags", ",".join(tags),
+        "--importance", str(importance),
+        "--type", memory_type,
+    ]
+
+
+def _store_in_cortex_sync(content: str, tags: list[str], importance: int, memory_type: str) -> bool:
+    """Store a memory by running the cortex CLI (blocking)."""
     try:
         # Use cortex CLI to store the memory
-        cmd = [
-            "cortex", "remember",
-            "--content", content,
-            "--tags", ",".join(tags),
-            "--importance", str(importance),
-            "--type", memory_type,
-        ]
         result = subprocess.run(
-            cmd,
+            _cortex_cmd(content, tags, importance, memory_type),
             capture_output=True,
             text=True,
             timeout=10,
@@ -87,6 +147,113 @@ def store_in_cortex(content: str, tags: list[str], importance: int = 80, memory_
         return False
 
 
+async def _store_in_cortex_async(content: str, tags: list[str], importance: int, memory_type: str) -> bool:
+    """Store a memory by running the cortex CLI as an asyncio subprocess."""
+    proc = None
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *_cortex_cmd(content, tags, importance, memory_type),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=str(project_root),
+        )
+        _, stderr = await asyncio.wait_for(proc.communicate(), timeout=10)
+        if proc.returncode == 0:
+            return True
+        print(f"[ADW] Warning: Could not store to Cortex: {stderr.decode(errors='replace')[:100]}")
+        return False
+    except asyncio.CancelledError:
+        if proc is not None and proc.returncode is None:
+            proc.kill()
+        raise
+    except Exception as e:
+        # Silently fail - memory storage is best-effort
+        if proc is not None and proc.returncode is None:
+            proc.kill()
+        print(f"[ADW] Warning: Cortex storage failed: {e}")
+        return False
+
+
+async def _cortex_worker_loop(queue: asyncio.Queue) -> None:
+    """Drain queued Cortex writes without blocking the event loop.
+
+    Entries that pile up while a write is in flight are taken as one batch
+    and their CLI processes run concurrently.
+    """
+    # Entries taken off the queue whose write has not finished yet
+    unfinished: list[tuple] = []
+
+    async def store(entry: tuple) -> None:
+        await _store_in_cortex_async(*entry)
+        unfinished.remove(entry)
+
+    try:
+        while True:
+            batch = [await queue.get()]
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            unfinished.extend(batch)
+            try:
+                await asyncio.gather(*(store(entry) for entry in batch))
+            finally:
+                for _ in batch:
+                    queue.task_done()
+    finally:
+        # Loop is shutting down - store the interrupted batch and whatever
+        # is still queued
+        for entry in unfinished:
+            _store_in_cortex_sync(*entry)
+        while not queue.empty():
+            _store_in_cortex_sync(*queue.get_nowait())
+            queue.task_done()
+
+
+def store_in_cortex(content: str, tags: list[str], importance: int = 80, memory_type: str = "troubleshooting") -> bool:
+    """Store information in Omni-Cortex for retrospective access.
+
+    Uses the cortex CLI to store memories directly, enabling retrospective
+    phases to access build errors and decisions. Inside a running event loop
+    the write is queued for a background worker so the caller never waits
+    on the CLI; outside a loop it runs synchronously.
+
+    Args:
+        content: The content to remember
+        tags: List of tags for categorization
+        importance: 1-100 importance score
+        memory_type: Type of memory (troubleshooting, decision, etc.)
+
+    Returns:
+        True if stored (or queued) successfully, False otherwise
+    """
+    global _cortex_queue, _cortex_worker
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return _store_in_cortex_sync(content, tags, importance, memory_type)
+
+    if _cortex_worker is None or _cortex_worker.done():
+        _cortex_queue = asyncio.Queue()
+        _cortex_worker = asyncio.create_task(_cortex_worker_loop(_cortex_queue))
+
+    _cortex_queue.put_nowait((content, tags, importance, memory_type))
+    return True
+
+
+async def drain_cortex_queue(timeout: float = 2.0) -> None:
+    """Wait up to timeout seconds for queued Cortex writes to finish.
+
+    Anything still pending afterwards, including a batch whose write was
+    in flight, is stored synchronously when the loop shuts down.
+    """
+    if _cortex_queue is None:
+        return
+    try:
+        await asyncio.wait_for(_cortex_queue.join(), timeout)
+    except asyncio.TimeoutError:
+        print(f"[ADW] Cortex writes still pending: {_cortex_queue.qsize()}")
+
+
 def track_error(
     error_msg: str,
     adw_id: str,
@@ -142,6 +309,241 @@ Timestamp: {datetime.now().isoformat()}"""
     store_in_cortex(content, tags, importance, "troubleshooting")
 
 
+@functools.lru_cache(maxsize=32)
+def _agent_options(model: str, cwd: str, max_turns: int) -> ClaudeAgentOptions:
+    """Build the SDK options template for a (model, cwd, max_turns) run.
+
+    Callers get the cached template and should take a copy with
+    _fresh_options before use.
+    """
+    return ClaudeAgentOptions(
+        model=model,
+        cwd=cwd,
+        max_turns=max_turns,
+        allowed_tools=list(ALLOWED_TOOLS),
+        permission_mode="acceptEdits",
+        env=dict(_ADW_ENV),
+        setting_sources=["project", "user"],  # Load project + user commands/skills
+    )
+
+
+def _fresh_options(template: ClaudeAgentOptions) -> ClaudeAgentOptions:
+    """Copy an options template with its own mutable containers.
+
+    A shallow copy would share allowed_tools, env and setting_sources, so a
+    change made for one session would leak into the cached template.
+    """
+    return dataclasses.replace(
+        template,
+        allowed_tools=list(template.allowed_tools),
+        env=dict(template.env),
+        setting_sources=list(template.setting_sources),
+    )
+
+
+def _drain_writer(q: queue.Queue, output_file: Path) -> None:
+    """Write encoded JSONL entries from q until a None sentinel arrives.
+
+    Runs on a worker thread so file I/O never blocks the event loop.
+    """
+    with open(output_file, "wb", buffering=JSONL_BUFFER_SIZE) as f:
+        while (item := q.get()) is not None:
+            if item is _FLUSH:
+                f.flush()
+            else:
+                f.write(item)
+
+
+def _print_banner(*lines: str) -> None:
+    """Print lines framed by rules, as a single stdout write."""
+    rule = "=" * 60
+    sys.stdout.write(f"\n{rule}\n" + "".join(f"{line}\n" for line in lines) + f"{rule}\n\n")
+
+
+def _report_sdk_failure(
+    error: Exception, adw_id: str, phase: str, agent_name: str, attempt: int = 1
+) -> tuple[bool, str, Optional[str]]:
+    """Print and track an SDK failure, returning run_claude_code's failure tuple."""
+    error_msg = f"Error running Claude SDK: {error}"
+    print(f"[ADW ERROR] {error_msg}")
+
+    # Track the error in Omni-Cortex for retrospective visibility
+    track_error(
+        error_msg=str(error),
+        adw_id=adw_id,
+        phase=phase,
+        agent_name=agent_name,
+        attempt=attempt,
+        is_unresolved_final=True,  # SDK errors are typically fatal
+    )
+
+    _print_banner(
+        f"[ADW] Phase {phase} FAILED",
+        "[ADW] Error stored in Cortex for retrospective",
+    )
+
+    return False, error_msg, None
+
+
+class ADWAgentSession:
+    """One Claude SDK client reused for several prompts.
+
+    Prompts sent through a session share one conversation, so only reuse a
+    session for steps that should see each other's context. Independent
+    phases and parallel subagents should each use their own session.
+
+    Usage:
+        async with ADWAgentSession(model="sonnet") as session:
+            success, output, output_file = await session.run(prompt, adw_id, "build")
+    """
+
+    def __init__(
+        self,
+        model: str = "sonnet",
+        cwd: Optional[str] = None,
+        max_turns: int = 50,
+        verbose: bool = True,
+    ):
+        # Resolve model alias
+        self.model = MODEL_ALIASES.get(model.lower(), model)
+        self.cwd = cwd or str(Path.cwd())
+        self.max_turns = max_turns
+        self.verbose = verbose  # Echo agent text and tool use to stdout
+        self._client: Optional[ClaudeSDKClient] = None
+        # Set once the agent has used a tool; side effects make a retry unsafe
+        self.tool_used = False
+
+    async def __aenter__(self) -> "ADWAgentSession":
+        options = _fresh_options(_agent_options(self.model, self.cwd, self.max_turns))
+        client = ClaudeSDKClient(options=options)
+        await client.__aenter__()
+        self._client = client
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        client, self._client = self._client, None
+        if client is not None:
+            await client.__aexit__(*exc_info)
+
+    async def run(
+        self, prompt: str, adw_id: str, phase: str, agent_name: str = "main"
+    ) -> tuple[bool, str, Optional[str]]:
+        """Send a prompt and drain the response into a phase-scoped JSONL log.
+
+        Returns:
+            Tuple of (success, output, output_file_path)
+        """
+        try:
+            return await self._run(prompt, adw_id, phase, agent_name)
+        except Exception as e:
+            return _report_sdk_failure(e, adw_id, phase, agent_name)
+
+    async def _run(
+        self, prompt: str, adw_id: str, phase: str, agent_name: str
+    ) -> tuple[bool, str, Optional[str]]:
+        """Like run(), but SDK errors propagate to the caller."""
+        if self._client is None:
+            raise RuntimeError("ADWAgentSession.run() called outside 'async with'")
+
+        # Prepare output directory
+        phase_dir = get_phase_dir(adw_id, phase)
+        output_file = phase_dir / f"{agent_name}_output.jsonl"
+
+        _print_banner(
+            f"[ADW] Phase: {phase} | Agent: {agent_name}",
+            f"[ADW] Model: {self.model} | Max turns: {self.max_turns}",
+            f"[ADW] Working dir: {self.cwd}",
+        )
+
+        # Assistant text returned to the caller; full entries live only on disk
+        text_parts: list[str] = []
+
+        await self._client.query(prompt)
+
+        # Entries are encoded here and written by a background thread
+        write_queue: queue.Queue = queue.Queue()
+        writer = asyncio.create_task(
+            asyncio.to_thread(_drain_writer, write_queue, output_file)
+        )
+
+        def log_entries(entries: list[dict]) -> None:
+            write_queue.put_nowait(b"".join(
+                json.dumps(e, separators=(",", ":")).encode() + b"\n" for e in entries
+            ))
+
+        # Console echo is written per message on a terminal, and batched by
+        # size or age when piped. Lines are tagged with the phase, since
+        # phases may run concurrently and each flush writes whole lines.
+        console = io.StringIO()
+        prefix = f"[{phase}] "
+        interactive = sys.stdout.isatty()
+        loop = asyncio.get_running_loop()
+        flush_handle: Optional[asyncio.TimerHandle] = None
+
+        def flush_console() -> None:
+            nonlocal flush_handle
+            if flush_handle is not None:
+                flush_handle.cancel()
+                flush_handle = None
+            if console.tell():
+                sys.stdout.write(console.getvalue())
+                sys.stdout.flush()
+                console.seek(0)
+                console.truncate()
+
+        try:
+            async for message in self._client.receive_response():
+                timestamp = datetime.now().isoformat()
+
+                if isinstance(message, AssistantMessage):
+                    entries = [
+                        handler(block, timestamp)
+                        for block in message.content
+                        if (handler := _BLOCK_HANDLERS.get(type(block)))
+                    ]
+                    if entries:
+                        log_entries(entries)
+
+                    # Thinking (when captured) is logged but not printed
+                    for entry in entries:
+                        if entry["type"] == "tool_use":
+                            self.tool_used = True
+                        if entry["type"] == "text":
+                            text_parts.append(entry["content"] + "\n")
+                            if self.verbose:
+                                for line in entry["content"].split("\n"):
+                                    console.write(prefix + line + "\n")
+                        elif entry["type"] == "tool_use" and self.verbose:
+                            console.write(f"{prefix}[Tool] {entry['tool_name']}\n")
+                    if interactive or console.tell() >= CONSOLE_FLUSH_CHARS:
+                        flush_console()
+                    elif console.tell() and flush_handle is None:
+                        # Don't hold text back while the agent works quietly
+                        flush_handle = loop.call_later(CONSOLE_FLUSH_INTERVAL, flush_console)
+
+                elif isinstance(message, ResultMessage):
+                    # Capture final result and usage
+                    log_entries([{
+                        "type": "result",
+                        "session_id": message.session_id,
+                        "usage": message.usage if hasattr(message, 'usage') else None,
+                        "timestamp": timestamp,
+                    }])
+                    write_queue.put_nowait(_FLUSH)
+                    flush_console()
+        finally:
+            flush_console()
+            write_queue.put_nowait(None)
+            await writer
+
+        _print_banner(
+            f"[ADW] Phase {phase} COMPLETED",
+            f"[ADW] Output saved to: {output_file}",
+        )
+
+        return True, "".join(text_parts), str(output_file)
+
+
 async def run_claude_code(
     prompt: str,
     adw_id: str,
@@ -151,9 +553,16 @@ async def run_claude_code(
     max_turns: int = 50,
     cwd: Optional[str] = None,
     capture_output: bool = True,
+    verbose: bool = True,
 ) -> tuple[bool, str, Optional[str]]:
     """Execute Claude via SDK with a prompt.
 
+    Runs the prompt in a one-shot ADWAgentSession. At most
+    ADW_MAX_CONCURRENCY calls run at once, and rate-limit or server errors
+    are retried with exponential backoff up to MAX_RETRIES attempts, as
+    long as the agent has not used any tool yet. A concurrency slot is held
+    only while an attempt runs, not during the backoff.
+
     Args:
         prompt: The prompt to send to Claude
         adw_id: The ADW ID for output organization
@@ -163,129 +572,36 @@ async def run_claude_code(
         max_turns: Maximum agentic turns
         cwd: Working directory (defaults to current)
         capture_output: Whether to capture and save output
+        verbose: Echo agent text and tool use to stdout
 
     Returns:
         Tuple of (success, output, output_file_path)
     """
-    # Resolve model alias
-    resolved_model = MODEL_ALIASES.get(model.lower(), model)
-
-    # Prepare output directory
-    phase_dir = get_phase_dir(adw_id, phase)
-    output_file = phase_dir / f"{agent_name}_output.jsonl"
-
-    working_dir = cwd or str(Path.cwd())
-
-    print(f"\n{'='*60}")
-    print(f"[ADW] Phase: {phase} | Agent: {agent_name}")
-    print(f"[ADW] Model: {resolved_model} | Max turns: {max_turns}")
-    print(f"[ADW] Working dir: {working_dir}")
-    print(f"{'='*60}\n")
-
-    # Default allowed tools for ADW execution
-    allowed_tools = [
-        "Read", "Write", "Edit", "Bash", "Glob", "Grep",
-        "Task", "WebFetch", "WebSearch", "TodoWrite",
-        "Skill", "AskUserQuestion",
-    ]
-
-    # Pass ANTHROPIC_API_KEY to subprocess
-    env_vars = {}
-    if "ANTHROPIC_API_KEY" in os.environ:
-        env_vars["ANTHROPIC_API_KEY"] = os.environ["ANTHROPIC_API_KEY"]
-
-    options = ClaudeAgentOptions(
-        model=resolved_model,
-        cwd=working_dir,
-        max_turns=max_turns,
-        allowed_tools=allowed_tools,
-        permission_mode="acceptEdits",
-        env=env_vars,
-        setting_sources=["project", "user"],  # Load project + user commands/skills
-    )
-
-    output_lines = []
-    final_result = ""
-    success = True
-
-    try:
-        async with ClaudeSDKClient(options=options) as client:
-            await client.query(prompt)
-
-            with open(output_file, "w", encoding="utf-8") as f:
-                async for message in client.receive_response():
-                    if isinstance(message, AssistantMessage):
-                        for block in message.content:
-                            if isinstance(block, TextBlock):
-                                print(block.text)
-                                final_result += block.text + "\n"
-                                entry = {
-                                    "type": "text",
-                                    "content": block.text,
-                                    "timestamp": datetime.now().isoformat(),
-                                }
-                                output_lines.append(entry)
-                                f.write(json.dumps(entry) + "\n")
-
-                            elif isinstance(block, ThinkingBlock):
-                                # Log thinking but don't print
-                                entry = {
-                                    "type": "thinking",
-                                    "content": block.thinking,
-                                    "timestamp": datetime.now().isoformat(),
-                                }
-                                output_lines.append(entry)
-                                f.write(json.dumps(entry) + "\n")
-
-                            elif isinstance(block, ToolUseBlock):
-                                print(f"[Tool] {block.name}")
-                                entry = {
-                                    "type": "tool_use",
-                                    "tool_name": block.name,
-                                    "tool_input": block.input,
-                                    "timestamp": datetime.now().isoformat(),
-                                }
-                                output_lines.append(entry)
-                                f.write(json.dumps(entry) + "\n")
-
-                    elif isinstance(message, ResultMessage):
-                        # Capture final result and usage
-                        entry = {
-                            "type": "result",
-                            "session_id": message.session_id,
-                            "usage": message.usage if hasattr(message, 'usage') else None,
-                            "timestamp": datetime.now().isoformat(),
-                        }
-                        output_lines.append(entry)
-                        f.write(json.dumps(entry) + "\n")
-
-        print(f"\n{'='*60}")
-        print(f"[ADW] Phase {phase} COMPLETED")
-        print(f"[ADW] Output saved to: {output_file}")
-        print(f"{'='*60}\n")
-
-        return True, final_result, str(output_file)
-
-    except Exception as e:
-        error_msg = f"Error running Claude SDK: {e}"
-        print(f"[ADW ERROR] {error_msg}")
-
-        # Track the error in Omni-Cortex for retrospective visibility
-        track_error(
-            error_msg=str(e),
-            adw_id=adw_id,
-            phase=phase,
-            agent_name=agent_name,
-            attempt=1,  # First attempt failure tracked
-            is_unresolved_final=True,  # SDK errors are typically fatal
-        )
-
-        print(f"\n{'='*60}")
-        print(f"[ADW] Phase {phase} FAILED")
-        print(f"[ADW] Error stored in Cortex for retrospective")
-        print(f"{'='*60}\n")
-
-        return False, error_msg, None
+    for attempt in range(1, MAX_RETRIES + 1):
+        session = ADWAgentSession(model=model, cwd=cwd, max_turns=max_turns, verbose=verbose)
+        try:
+            async with _API_SEMAPHORE, session:
+                return await session._run(prompt, adw_id, phase, agent_name)
+        except Exception as e:
+            # Never replay a prompt whose tools may already have edited files
+            if (
+                attempt == MAX_RETRIES
+                or session.tool_used
+                or not _RETRYABLE_ERROR.search(str(e))
+            ):
+                return _report_sdk_failure(e, adw_id, phase, agent_name, attempt)
+
+            # Rate limit or server error: back off with jitter and retry
+            delay = min(2 ** attempt + random.random(), RETRY_MAX_DELAY)
+            print(f"[ADW] Transient SDK error (attempt {attempt}/{MAX_RETRIES}), retrying in {delay:.1f}s: {e}")
+            track_error(
+                error_msg=str(e),
+                adw_id=adw_id,
+                phase=phase,
+                agent_name=agent_name,
+                attempt=attempt,
+            )
+            await asyncio.sleep(delay)
 
 
 async def run_skill(
@@ -2,8 +2,8 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import Any, Optional
+from pydantic import BaseModel, Field, field_serializer, field_validator
 
 
 class ADWPhase(str, Enum):
@@ -23,6 +23,25 @@ class ADWPhase(str, Enum):
     RELEASE = "release"
 
 
+# Position of each phase in the standard workflow order
+_PHASE_ORDER = {phase: i for i, phase in enumerate(ADWPhase)}
+
+
+def _to_epoch_ms(value: Optional[datetime]) -> Optional[int]:
+    """Serialize a timestamp compactly as integer Unix milliseconds."""
+    return None if value is None else int(value.timestamp() * 1000)
+
+
+def _from_epoch_ms(value: Any) -> Any:
+    """Parse Unix milliseconds back to a local datetime.
+
+    ISO strings written by older state files pass through unchanged.
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return datetime.fromtimestamp(value / 1000)
+    return value
+
+
 class PhaseResult(BaseModel):
     """Result of a phase execution."""
     phase: ADWPhase
@@ -33,19 +52,49 @@ class PhaseResult(BaseModel):
     error_message: Optional[str] = None
     artifacts: list[str] = Field(default_factory=list)
 
+    @field_validator("started_at", "completed_at", mode="before")
+    @classmethod
+    def _parse_timestamps(cls, value: Any) -> Any:
+        return _from_epoch_ms(value)
+
+    @field_serializer("started_at", "completed_at", when_used="json")
+    def _serialize_timestamps(self, value: Optional[datetime]) -> Optional[int]:
+        """Persist timestamps as Unix milliseconds."""
+        return _to_epoch_ms(value)
+
 
 class ADWStateData(BaseModel):
     """Complete state of an ADW execution."""
     adw_id: str
     task_description: str
     created_at: datetime = Field(default_factory=datetime.now)
-    current_phase: Optional[ADWPhase] = None
-    completed_phases: list[ADWPhase] = Field(default_factory=list)
+    current_phase: Optional[ADWPhase] = None  # Most recently started running phase
+    current_phases: list[ADWPhase] = Field(default_factory=list)  # All running phases
+    completed_phases: set[ADWPhase] = Field(default_factory=set)
     phase_results: list[PhaseResult] = Field(default_factory=list)
     spec_file: Optional[str] = None
     project_path: str = ""
     status: str = "pending"  # pending, running, completed, failed
 
+    @field_validator("created_at", mode="before")
+    @classmethod
+    def _parse_created_at(cls, value: Any) -> Any:
+        return _from_epoch_ms(value)
+
+    @field_serializer("created_at", when_used="json")
+    def _serialize_created_at(self, value: datetime) -> int:
+        """Persist the creation time as Unix milliseconds."""
+        return _to_epoch_ms(value)
+
+    def completed_in_order(self) -> list[ADWPhase]:
+        """Get completed phases in standard workflow order."""
+        return sorted(self.completed_phases, key=_PHASE_ORDER.__getitem__)
+
+    @field_serializer("completed_phases")
+    def _serialize_completed_phases(self, phases: set[ADWPhase]) -> list[ADWPhase]:
+        """Persist completed phases as a stable, ordered list."""
+        return self.completed_in_order()
+
 
 class ReviewIssue(BaseModel):
     """An issue found during review."""
@@ -0,0 +1,121 @@
+"""Dependency-driven phase scheduler for ADW orchestrators.
+
+Phases declare which other phases they depend on. Every phase whose
+dependencies are satisfied is dispatched as its own asyncio task, so
+independent phases (e.g. the SECURITY audit and REVIEW in the complete
+SDLC workflow) overlap their Claude Code latency instead of running back
+to back.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Iterable, NamedTuple, Optional
+
+
+class Phase(NamedTuple):
+    """A node in the phase DAG.
+
+    Attributes:
+        name: Unique phase name, referenced by other phases' deps
+        deps: Names of phases that must finish before this one starts.
+              Names not scheduled in the same run (skipped phases) are ignored.
+        coro: Coroutine function taking the ADW state, returning success
+        blocking: If True, a failure stops any phase that hasn't started yet
+    """
+    name: str
+    deps: Iterable[str]
+    coro: Callable[[Any], Awaitable[bool]]
+    blocking: bool = False
+
+
+async def schedule(
+    phases: list[Phase],
+    state: Any,
+    on_complete: Optional[Callable[[str, bool], None]] = None,
+) -> dict[str, bool]:
+    """Run phases concurrently as soon as their dependencies complete.
+
+    Args:
+        phases: Phases to run, in declaration order
+        state: ADW state passed to every phase coroutine
+        on_complete: Called with (name, success) as each phase finishes
+
+    Returns:
+        Mapping of phase name to success for every phase that ran
+    """
+    scheduled = {p.name for p in phases}
+    pending = list(phases)
+    running: dict[asyncio.Task, Phase] = {}
+    done: set[str] = set()
+    results: dict[str, bool] = {}
+    stopped = False
+
+    while pending or running:
+        if not stopped:
+            ready = [p for p in pending if set(p.deps) & scheduled <= done]
+            for phase in ready:
+                pending.remove(phase)
+                running[asyncio.create_task(phase.coro(state))] = phase
+
+        if not running:
+            # Blocking failure, or nothing left whose deps can be satisfied
+            break
+
+        finished, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+        for task in finished:
+            phase = running.pop(task)
+            try:
+                success = bool(task.result())
+            except BaseException:
+                for other in running:
+                    other.cancel()
+                # Let cancelled phases finish their cleanup before the caller
+                # records the failure
+                await asyncio.gather(*running, return_exceptions=True)
+                raise
+
+            results[phase.name] = success
+            done.add(phase.name)
+            if on_complete:
+                on_complete(phase.name, success)
+            if phase.blocking and not success:
+                stopped = True
+
+    return results
+
+
+def orchestrator_phase(
+    name: Any,
+    number: int,
+    total: int,
+    deps: Iterable[str],
+    runner: Callable[..., Awaitable[bool]],
+    *failure_notes: str,
+    **kwargs: Any,
+) -> Phase:
+    """Wrap a phase runner as a blocking Phase with the standard banners.
+
+    Args:
+        name: Phase name (an ADWPhase)
+        number: Position shown in the "PHASE n/total" header
+        total: Number of phases in the workflow
+        deps: Names of phases that must finish first
+        runner: Phase runner taking the ADW state and **kwargs
+        failure_notes: Lines printed if the runner fails
+        **kwargs: Extra arguments passed to the runner
+
+    Returns:
+        The Phase, stopping later phases when it fails
+    """
+    async def _run(state: Any) -> bool:
+        print("\n" + "-" * 50)
+        print(f"PHASE {number}/{total}: {name.value.upper()}")
+        print("-" * 50)
+        if not await runner(state, **kwargs):
+            print()
+            for note in failure_notes:
+                print(f"[ORCHESTRATOR] {note}")
+            return False
+        print(f"\n[ORCHESTRATOR] {name.value.capitalize()} complete.")
+        return True
+
+    return Phase(name, deps, _run, blocking=True)
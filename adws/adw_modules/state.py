@@ -1,6 +1,10 @@
 """ADW State management with JSON persistence."""
 
-import json
+import asyncio
+import atexit
+import os
+import threading
+import weakref
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -8,17 +12,47 @@ from typing import Optional
 from .data_types import ADWPhase, ADWStateData, PhaseResult
 from .utils import get_agents_dir
 
+# Mutations within this window (seconds) are coalesced into one write
+FLUSH_DELAY = 0.05
+
+# Live states by ADW id, reused by ADWState.load while the file is unchanged
+_STATE_CACHE: "weakref.WeakValueDictionary[str, ADWState]" = weakref.WeakValueDictionary()
+_STATE_CACHE_LOCK = threading.RLock()
+
+
+def _flush_live_states() -> None:
+    """Write pending changes of every cached state on interpreter exit.
+
+    Only the current instance per ADW id is flushed, so a superseded
+    instance can never overwrite newer state with its stale data.
+    """
+    with _STATE_CACHE_LOCK:
+        states = list(_STATE_CACHE.values())
+    for state in states:
+        state.flush()
+
+
+atexit.register(_flush_live_states)
+
 
 class ADWState:
     """Manages ADW state with JSON file persistence.
 
     State is stored in: agents/{adw_id}/adw_state.json
+
+    Inside a running event loop, writes are debounced: mutations mark the
+    state dirty and a single write happens FLUSH_DELAY seconds later. Call
+    flush() before handing control to a subprocess so state is crash-safe.
     """
 
     def __init__(self, adw_id: str, task_description: str = "", project_path: str = ""):
         """Initialize or load ADW state."""
         self.adw_id = adw_id
         self.state_file = get_agents_dir(adw_id) / "adw_state.json"
+        self._dirty = False
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._mtime: Optional[int] = None
+        self._written: Optional[str] = None  # Content of the state file as last read/written
 
         if self.state_file.exists():
             self.data = self._load()
@@ -28,21 +62,88 @@ class ADWState:
                 task_description=task_description,
                 project_path=project_path or str(Path.cwd()),
             )
-            self._save()
+            self._write_atomic()
+
+        # Latest result per phase; phase_results stays the persisted history
+        self._results_by_phase: dict[ADWPhase, PhaseResult] = {
+            result.phase: result for result in self.data.phase_results
+        }
+
+        with _STATE_CACHE_LOCK:
+            _STATE_CACHE[adw_id] = self
+
+    @classmethod
+    def load(cls, adw_id: str) -> Optional["ADWState"]:
+        """Load an existing ADW state, or None if it has no state file.
+
+        Returns the instance already in memory for this ADW unless the
+        file was changed on disk since that instance last read or wrote it.
+        """
+        state_file = get_agents_dir(adw_id) / "adw_state.json"
+        try:
+            mtime = state_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+        with _STATE_CACHE_LOCK:
+            cached = _STATE_CACHE.get(adw_id)
+            if cached is not None and (cached._dirty or cached._mtime == mtime):
+                return cached
+            return cls(adw_id)
 
     def _load(self) -> ADWStateData:
         """Load state from JSON file."""
-        with open(self.state_file, "r") as f:
-            data = json.load(f)
-        return ADWStateData(**data)
-
-    def _save(self) -> None:
-        """Save state to JSON file."""
-        with open(self.state_file, "w") as f:
-            json.dump(self.data.model_dump(mode="json"), f, indent=2, default=str)
+        self._mtime = self.state_file.stat().st_mtime_ns
+        self._written = self.state_file.read_text(encoding="utf-8")
+        return ADWStateData.model_validate_json(self._written)
+
+    def _write_atomic(self) -> None:
+        """Save state to JSON file.
+
+        Writes compact JSON to a temp file and swaps it in with os.replace,
+        so readers never see a torn file. Skipped when the content matches
+        what this instance last wrote and the file is unchanged on disk.
+        """
+        content = self.data.model_dump_json(exclude_none=True)
+        if content == self._written:
+            try:
+                if self.state_file.stat().st_mtime_ns == self._mtime:
+                    return
+            except FileNotFoundError:
+                pass
+        tmp = self.state_file.with_suffix(".json.tmp")
+        tmp.write_text(content, encoding="utf-8")
+        os.replace(tmp, self.state_file)
+        self._mtime = self.state_file.stat().st_mtime_ns
+        self._written = content
+
+    def mark_dirty(self) -> None:
+        """Schedule a coalesced write of the state file.
+
+        Writes immediately when no event loop is running.
+        """
+        self._dirty = True
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+            return
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(FLUSH_DELAY, self.flush)
+
+    def flush(self) -> None:
+        """Write any pending state changes to disk now."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._dirty:
+            self._dirty = False
+            self._write_atomic()
 
     def start_phase(self, phase: ADWPhase) -> None:
         """Mark a phase as started."""
+        if phase not in self.data.current_phases:
+            self.data.current_phases.append(phase)
         self.data.current_phase = phase
         self.data.status = "running"
 
@@ -53,7 +154,8 @@ class ADWState:
             started_at=datetime.now(),
         )
         self.data.phase_results.append(result)
-        self._save()
+        self._results_by_phase[phase] = result
+        self.mark_dirty()
 
     def complete_phase(
         self,
@@ -64,56 +166,64 @@ class ADWState:
         artifacts: Optional[list[str]] = None,
     ) -> None:
         """Mark a phase as completed."""
-        # Find and update the phase result
-        for result in self.data.phase_results:
-            if result.phase == phase and result.completed_at is None:
-                result.success = success
-                result.completed_at = datetime.now()
-                result.output_file = output_file
-                result.error_message = error_message
-                if artifacts:
-                    result.artifacts = artifacts
-                break
+        # Update the phase result if it is still open
+        result = self._results_by_phase.get(phase)
+        if result is not None and result.completed_at is None:
+            result.success = success
+            result.completed_at = datetime.now()
+            result.output_file = output_file
+            result.error_message = error_message
+            if artifacts:
+                result.artifacts = artifacts
 
         if success:
-            self.data.completed_phases.append(phase)
-
-        self.data.current_phase = None
-        self._save()
+            self.data.completed_phases.add(phase)
+
+        # Other phases may still be running concurrently
+        if phase in self.data.current_phases:
+            self.data.current_phases.remove(phase)
+        if self.data.current_phase == phase:
+            self.data.current_phase = (
+                self.data.current_phases[-1] if self.data.current_phases else None
+            )
+        self.mark_dirty()
 
     def set_spec_file(self, spec_file: str) -> None:
         """Set the spec file path."""
         self.data.spec_file = spec_file
-        self._save()
+        self.mark_dirty()
 
     def mark_completed(self) -> None:
         """Mark the entire ADW as completed."""
         self.data.status = "completed"
-        self._save()
+        self.mark_dirty()
+        self.flush()
 
     def mark_failed(self, error: str) -> None:
         """Mark the entire ADW as failed."""
         self.data.status = "failed"
-        # Update current phase result if exists
-        if self.data.current_phase:
+        # Fail every phase that is still running
+        for phase in list(self.data.current_phases):
             self.complete_phase(
-                self.data.current_phase,
+                phase,
                 success=False,
                 error_message=error,
             )
-        self._save()
+        self.mark_dirty()
+        self.flush()
 
     def get_phase_result(self, phase: ADWPhase) -> Optional[PhaseResult]:
-        """Get the result of a specific phase."""
-        for result in self.data.phase_results:
-            if result.phase == phase:
-                return result
-        return None
+        """Get the most recent result of a specific phase."""
+        return self._results_by_phase.get(phase)
 
     def is_phase_completed(self, phase: ADWPhase) -> bool:
         """Check if a phase has been completed successfully."""
         return phase in self.data.completed_phases
 
+    def completed_phases_text(self) -> str:
+        """Get completed phase names in workflow order, comma-separated."""
+        return ", ".join(p.value for p in self.data.completed_in_order())
+
     @property
     def task(self) -> str:
         """Get the task description."""
@@ -1,10 +1,44 @@
 """Utility functions for ADWs."""
 
+import asyncio
+import functools
+import itertools
 import os
-import secrets
+import platform
+import signal
 import subprocess
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Coroutine, Optional, Union
+
+# Host platform, fixed for the life of the process
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == "Windows"
+_IS_LINUX = _SYSTEM == "Linux"
+
+
+async def _with_eager_tasks(main: Coroutine[Any, Any, Any]) -> Any:
+    """Await main with eager task execution enabled on the running loop."""
+    asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    return await main
+
+
+def run_async(main: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine to completion, like asyncio.run.
+
+    Uses uvloop's faster event loop when it is installed (the optional
+    "adw" extra); otherwise falls back to the standard asyncio loop. On
+    Python 3.12+ tasks start eagerly, so ones that finish without
+    suspending never go through the scheduler.
+    """
+    if hasattr(asyncio, "eager_task_factory"):
+        main = _with_eager_tasks(main)
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    return uvloop.run(main)
 
 
 def generate_adw_id() -> str:
@@ -13,9 +47,74 @@ def generate_adw_id() -> str:
     Format: adw_{timestamp}_{random_hex}
     Example: adw_1704825600_a1b2c3d4
     """
-    timestamp = int(datetime.now().timestamp())
-    random_hex = secrets.token_hex(4)
-    return f"adw_{timestamp}_{random_hex}"
+    return f"adw_{time.time_ns() // 1_000_000_000}_{os.urandom(4).hex()}"
+
+
+# Directories already created by this process, to skip repeat mkdir calls
+_ensured_dirs: set[Path] = set()
+
+
+def ensure_directory(path: Path) -> Path:
+    """Create path (and parents) once per process, returning it."""
+    if path not in _ensured_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(path)
+    return path
+
+
+# Entries that mark a directory as a project root
+_ROOT_MARKERS = frozenset((".git", "pyproject.toml", "package.json"))
+
+
+@functools.lru_cache(maxsize=8)
+def _find_project_root(cwd: str) -> Path:
+    """Walk up from cwd to the nearest project root marker.
+
+    Reads each directory once with scandir rather than stat-ing every marker.
+    """
+    current = Path(cwd)
+
+    for path in itertools.chain((current,), current.parents):
+        try:
+            with os.scandir(path) as entries:
+                if any(entry.name in _ROOT_MARKERS for entry in entries):
+                    return path
+        except (PermissionError, FileNotFoundError):
+            continue
+
+    return current
+
+
+def find_artifacts(
+    directory: Union[str, Path],
+    prefix: str = "",
+    suffix: str = "",
+    since: Optional[float] = None,
+) -> list[str]:
+    """List files in a directory whose names match prefix and suffix.
+
+    One scandir pass with plain string checks, cheaper than Path.glob.
+
+    Args:
+        directory: Directory to scan (not recursive)
+        prefix: Required file name prefix
+        suffix: Required file name suffix
+        since: If given, only files modified at or after this Unix time
+
+    Returns:
+        Matching file paths, or an empty list if the directory is missing
+    """
+    try:
+        with os.scandir(directory) as it:
+            return [
+                entry.path for entry in it
+                if entry.name.startswith(prefix)
+                and entry.name.endswith(suffix)
+                and entry.is_file(follow_symlinks=False)
+                and (since is None or entry.stat().st_mtime >= since)
+            ]
+    except FileNotFoundError:
+        return []
 
 
 def get_project_root() -> Path:
@@ -25,18 +124,10 @@ def get_project_root() -> Path:
     - .git directory
     - pyproject.toml
     - package.json
-    """
-    current = Path.cwd()
 
-    for path in [current] + list(current.parents):
-        if (path / ".git").exists():
-            return path
-        if (path / "pyproject.toml").exists():
-            return path
-        if (path / "package.json").exists():
-            return path
-
-    return current
+    The result is cached per working directory.
+    """
+    return _find_project_root(os.getcwd())
 
 
 def get_agents_dir(adw_id: str) -> Path:
@@ -44,10 +135,7 @@ def get_agents_dir(adw_id: str) -> Path:
 
     Creates: agents/{adw_id}/
     """
-    project_root = get_project_root()
-    agents_dir = project_root / "agents" / adw_id
-    agents_dir.mkdir(parents=True, exist_ok=True)
-    return agents_dir
+    return ensure_directory(get_project_root() / "agents" / adw_id)
 
 
 def get_phase_dir(adw_id: str, phase: str) -> Path:
@@ -55,30 +143,126 @@ def get_phase_dir(adw_id: str, phase: str) -> Path:
 
     Creates: agents/{adw_id}/{phase}/
     """
-    phase_dir = get_agents_dir(adw_id) / phase
-    phase_dir.mkdir(parents=True, exist_ok=True)
-    return phase_dir
+    return ensure_directory(get_agents_dir(adw_id) / phase)
 
 
 def format_duration(seconds: float) -> str:
     """Format duration in human-readable form."""
     if seconds < 60:
         return f"{seconds:.1f}s"
-    elif seconds < 3600:
-        mins = int(seconds // 60)
-        secs = int(seconds % 60)
+    whole = int(seconds)
+    if whole < 3600:
+        mins, secs = divmod(whole, 60)
         return f"{mins}m {secs}s"
+    hours, rem = divmod(whole, 3600)
+    return f"{hours}h {rem // 60}m"
+
+
+def _find_listeners_linux(port: int) -> Optional[list[int]]:
+    """Find PIDs listening on a TCP port by reading /proc directly.
+
+    Matches LISTEN sockets in /proc/net/tcp{,6} by port, then maps their
+    inodes to owning processes through the /proc/<pid>/fd symlinks.
+
+    Returns:
+        Listening PIDs, or None if /proc/net is unavailable
+    """
+    port_suffix = f":{port:04X}"
+    sockets = set()
+    readable = False
+    for table in ("/proc/net/tcp", "/proc/net/tcp6"):
+        try:
+            with open(table, encoding="ascii") as f:
+                readable = True
+                next(f, None)  # Header
+                for line in f:
+                    fields = line.split()
+                    # local_address is HEXIP:HEXPORT; state 0A is LISTEN
+                    if fields[1].endswith(port_suffix) and fields[3] == "0A":
+                        sockets.add(f"socket:[{fields[9]}]")
+        except OSError:
+            continue
+
+    if not readable:
+        return None
+    if not sockets:
+        return []
+
+    def owns_socket(pid: str) -> bool:
+        try:
+            with os.scandir(f"/proc/{pid}/fd") as fds:
+                for fd in fds:
+                    try:
+                        if os.readlink(fd.path) in sockets:
+                            return True
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        return False
+
+    with os.scandir("/proc") as entries:
+        pids = [e.name for e in entries if e.name.isdigit()]
+
+    if len(pids) > 200:
+        with ThreadPoolExecutor() as ex:
+            owned = list(ex.map(owns_socket, pids))
     else:
-        hours = int(seconds // 3600)
-        mins = int((seconds % 3600) // 60)
-        return f"{hours}h {mins}m"
+        owned = [owns_socket(pid) for pid in pids]
+
+    return [int(pid) for pid, hit in zip(pids, owned) if hit]
+
+
+def _find_listeners_psutil(port: int) -> Optional[list[int]]:
+    """Find PIDs listening on a TCP port with psutil, if it is installed.
+
+    Returns:
+        Listening PIDs, or None if psutil is missing or may not list
+        other users' sockets (macOS without root)
+    """
+    try:
+        import psutil
+    except ImportError:
+        return None
+    try:
+        conns = psutil.net_connections(kind="tcp")
+    except psutil.AccessDenied:
+        return None
+    return list({
+        c.pid for c in conns
+        if c.pid and c.status == psutil.CONN_LISTEN and c.laddr and c.laddr.port == port
+    })
+
+
+def _kill_listeners(pids: list[int], port: int, verbose: bool) -> bool:
+    """Kill the given PIDs in-process; processes already gone are ignored."""
+    if not pids:
+        if verbose:
+            print(f"[Cleanup] Port {port} is free")
+        return True
+
+    # os.kill maps SIGTERM to TerminateProcess on Windows
+    sig = signal.SIGTERM if _IS_WINDOWS else signal.SIGKILL
+    for pid in pids:
+        try:
+            os.kill(pid, sig)
+            if verbose:
+                print(f"[Cleanup] Killed process {pid} on port {port}")
+        except ProcessLookupError:
+            pass  # Already exited
+        except Exception as e:
+            if verbose:
+                print(f"[Cleanup] Failed to kill process {pid}: {e}")
+    return True
 
 
 def cleanup_dashboard_ports(port: int = 8765, verbose: bool = False) -> bool:
     """Clean up orphaned processes on dashboard port.
 
     This prevents 'address already in use' errors when starting the dashboard
-    after a previous run didn't shut down cleanly.
+    after a previous run didn't shut down cleanly. Listeners are found
+    without spawning processes where possible (/proc on Linux, psutil
+    elsewhere when installed), falling back to netstat or lsof.
 
     Args:
         port: Port number to clean up (default: 8765)
@@ -87,51 +271,61 @@ def cleanup_dashboard_ports(port: int = 8765, verbose: bool = False) -> bool:
     Returns:
         True if cleanup was successful or not needed
     """
-    import platform
-
-    if platform.system() == "Windows":
+    try:
+        pids = _find_listeners_linux(port) if _IS_LINUX else _find_listeners_psutil(port)
+    except Exception as e:
+        if verbose:
+            print(f"[Cleanup] Error during cleanup: {e}")
+        return False
+    if pids is not None:
+        return _kill_listeners(pids, port, verbose)
+
+    if _IS_WINDOWS:
         try:
-            # Find processes using the port
+            # Find processes using the port; findstr trims netstat's output
+            # before Python sees it (port is an int, so the shell line is safe)
             result = subprocess.run(
-                ["netstat", "-ano"],
+                f'netstat -ano | findstr ":{port} "',
+                shell=True,
                 capture_output=True,
                 text=True,
                 timeout=5,
             )
 
-            if result.returncode != 0:
+            # findstr exits 1 when nothing matched
+            if result.returncode not in (0, 1) or (result.returncode == 1 and result.stderr.strip()):
                 if verbose:
                     print(f"[Cleanup] Could not check port {port}")
                 return False
 
-            # Parse output to find PIDs
+            # Parse output to find PIDs: Proto, Local, Foreign, State, PID
             pids = []
+            port_suffix = f":{port}"
             for line in result.stdout.splitlines():
-                if f":{port}" in line and "LISTENING" in line:
-                    parts = line.split()
-                    if parts:
-                        pid = parts[-1]
-                        if pid.isdigit():
-                            pids.append(pid)
+                if "LISTENING" not in line:
+                    continue
+                local, pid = line.split(None, 2)[1], line.rsplit(None, 1)[-1]
+                if local.endswith(port_suffix) and pid.isdigit() and pid not in pids:
+                    pids.append(pid)
 
             if not pids:
                 if verbose:
                     print(f"[Cleanup] Port {port} is free")
                 return True
 
-            # Kill each process
-            for pid in pids:
-                try:
-                    subprocess.run(
-                        ["powershell", "-Command", f"Stop-Process -Id {pid} -Force"],
-                        capture_output=True,
-                        timeout=5,
-                    )
-                    if verbose:
+            # Kill every process with a single PowerShell invocation
+            try:
+                subprocess.run(
+                    ["powershell", "-Command", f"Stop-Process -Id {','.join(pids)} -Force"],
+                    capture_output=True,
+                    timeout=5,
+                )
+                if verbose:
+                    for pid in pids:
                         print(f"[Cleanup] Killed process {pid} on port {port}")
-                except Exception as e:
-                    if verbose:
-                        print(f"[Cleanup] Failed to kill process {pid}: {e}")
+            except Exception as e:
+                if verbose:
+                    print(f"[Cleanup] Failed to kill processes {', '.join(pids)}: {e}")
 
             return True
 
@@ -149,24 +343,10 @@ def cleanup_dashboard_ports(port: int = 8765, verbose: bool = False) -> bool:
                 text=True,
                 timeout=5,
             )
-
-            if result.returncode != 0 or not result.stdout.strip():
-                if verbose:
-                    print(f"[Cleanup] Port {port} is free")
-                return True
-
-            pids = result.stdout.strip().split("\n")
-            for pid in pids:
-                if pid.isdigit():
-                    try:
-                        subprocess.run(["kill", "-9", pid], timeout=5)
-                        if verbose:
-                            print(f"[Cleanup] Killed process {pid} on port {port}")
-                    except Exception as e:
-                        if verbose:
-                            print(f"[Cleanup] Failed to kill process {pid}: {e}")
-
-            return True
+            pids = []
+            if result.returncode == 0:
+                pids = [int(pid) for pid in result.stdout.split() if pid.isdigit()]
+            return _kill_listeners(pids, port, verbose)
 
         except FileNotFoundError:
             if verbose:
@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 """ADW Plan Phase - Creates a spec using /quick-plan."""
 
-import asyncio
+import os
+import re
 import sys
 from pathlib import Path
 
@@ -11,7 +12,10 @@ sys.path.insert(0, str(Path(__file__).parent))
 from adw_modules.data_types import ADWPhase
 from adw_modules.state import ADWState
 from adw_modules.agent import run_skill
-from adw_modules.utils import generate_adw_id, get_project_root
+from adw_modules.utils import generate_adw_id, get_project_root, run_async
+
+# Spec path as reported by /quick-plan, which prints it near the end
+_SPEC_RE = re.compile(r"specs/todo/[\w-]+\.md")
 
 
 async def run_plan(task_description: str, adw_id: str = None) -> tuple[bool, ADWState]:
@@ -39,6 +43,7 @@ async def run_plan(task_description: str, adw_id: str = None) -> tuple[bool, ADW
     print(f"[ADW Plan] Task: {task_description}")
 
     state.start_phase(ADWPhase.PLAN)
+    state.flush()
 
     # Run /quick-plan skill (now async)
     success, output, output_file = await run_skill(
@@ -49,14 +54,29 @@ async def run_plan(task_description: str, adw_id: str = None) -> tuple[bool, ADW
     )
 
     if success:
-        # Try to find the generated spec file in specs/todo/
-        specs_todo_dir = get_project_root() / "specs" / "todo"
-        if specs_todo_dir.exists():
-            # Find most recent spec file in todo folder
-            spec_files = sorted(specs_todo_dir.glob("*.md"), key=lambda p: p.stat().st_mtime, reverse=True)
-            if spec_files:
-                state.set_spec_file(str(spec_files[0]))
-                print(f"[ADW Plan] Spec file: {spec_files[0]}")
+        # Prefer the spec path the skill reported, else the newest spec in specs/todo/
+        spec_file = None
+        reported = _SPEC_RE.findall(output[-4096:])
+        if reported:
+            candidate = get_project_root() / reported[-1]
+            if candidate.is_file():
+                spec_file = candidate
+        if spec_file is None:
+            try:
+                with os.scandir(get_project_root() / "specs" / "todo") as entries:
+                    newest = max(
+                        (e for e in entries if e.name.endswith(".md") and e.is_file(follow_symlinks=False)),
+                        key=lambda e: e.stat().st_mtime_ns,
+                        default=None,
+                    )
+            except FileNotFoundError:
+                newest = None
+            if newest is not None:
+                spec_file = Path(newest.path)
+
+        if spec_file is not None:
+            state.set_spec_file(str(spec_file))
+            print(f"[ADW Plan] Spec file: {spec_file}")
 
         state.complete_phase(
             ADWPhase.PLAN,
@@ -83,7 +103,7 @@ def main():
         sys.exit(1)
 
     task = " ".join(sys.argv[1:])
-    success, state = asyncio.run(run_plan(task))
+    success, state = run_async(run_plan(task))
 
     if success:
         print(f"\nPlan phase completed. ADW ID: {state.adw_id}")
@@ -12,6 +12,7 @@ Usage:
 """
 
 import asyncio
+import os
 import sys
 import time
 from pathlib import Path
@@ -20,7 +21,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from adw_modules.data_types import ADWPhase
-from adw_modules.utils import generate_adw_id, format_duration
+from adw_modules.utils import generate_adw_id, format_duration, ensure_directory, run_async
 from adw_plan import run_plan
 from adw_build import run_build
 from adw_validate import run_validate
@@ -38,12 +39,14 @@ async def run_plan_build_validate(task_description: str) -> bool:
     start_time = time.time()
     adw_id = generate_adw_id()
 
-    print("\n" + "=" * 70)
-    print("ADW ORCHESTRATOR: Plan -> Build -> Validate")
-    print("=" * 70)
-    print(f"ADW ID: {adw_id}")
-    print(f"Task: {task_description}")
-    print("=" * 70 + "\n")
+    sys.stdout.write("\n" + "\n".join([
+        "=" * 70,
+        "ADW ORCHESTRATOR: Plan -> Build -> Validate",
+        "=" * 70,
+        f"ADW ID: {adw_id}",
+        f"Task: {task_description}",
+        "=" * 70,
+    ]) + "\n\n")
 
     # Phase 1: PLAN
     print("\n" + "-" * 50)
@@ -88,27 +91,32 @@ async def run_plan_build_validate(task_description: str) -> bool:
     # All phases complete - move spec file to done/
     if state.spec:
         spec_path = Path(state.spec)
-        if spec_path.exists() and "specs/todo/" in str(spec_path):
-            done_dir = Path("specs/done")
-            done_dir.mkdir(parents=True, exist_ok=True)
-            new_spec_path = done_dir / spec_path.name
-            spec_path.rename(new_spec_path)
-            state.spec = str(new_spec_path)
-            print(f"\n[ORCHESTRATOR] Moved spec: {spec_path.name} -> specs/done/")
+        if "specs/todo/" in spec_path.as_posix():
+            new_spec_path = ensure_directory(Path("specs/done")) / spec_path.name
+            try:
+                await asyncio.to_thread(os.replace, spec_path, new_spec_path)
+            except FileNotFoundError:
+                pass
+            else:
+                state.set_spec_file(str(new_spec_path))
+                print(f"\n[ORCHESTRATOR] Moved spec: {spec_path.name} -> specs/done/")
 
     state.mark_completed()
     elapsed = time.time() - start_time
 
-    print("\n" + "=" * 70)
-    print("ADW WORKFLOW COMPLETED SUCCESSFULLY")
-    print("=" * 70)
-    print(f"ADW ID: {adw_id}")
-    print(f"Duration: {format_duration(elapsed)}")
-    print(f"Phases completed: {len(state.data.completed_phases)}")
-    print(f"State file: agents/{adw_id}/adw_state.json")
+    summary = [
+        "=" * 70,
+        "ADW WORKFLOW COMPLETED SUCCESSFULLY",
+        "=" * 70,
+        f"ADW ID: {adw_id}",
+        f"Duration: {format_duration(elapsed)}",
+        f"Phases completed: {len(state.data.completed_phases)}",
+        f"State file: agents/{adw_id}/adw_state.json",
+    ]
     if state.spec:
-        print(f"Spec file: {state.spec}")
-    print("=" * 70 + "\n")
+        summary.append(f"Spec file: {state.spec}")
+    summary.append("=" * 70)
+    sys.stdout.write("\n" + "\n".join(summary) + "\n\n")
 
     return True
 
@@ -133,7 +141,7 @@ def main():
         sys.exit(1)
 
     task = " ".join(sys.argv[1:])
-    success = asyncio.run(run_plan_build_validate(task))
+    success = run_async(run_plan_build_validate(task))
 
     if not success:
         sys.exit(1)
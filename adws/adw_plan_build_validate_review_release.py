@@ -16,6 +16,7 @@ Usage:
 
 import argparse
 import asyncio
+import os
 import sys
 import time
 from pathlib import Path
@@ -24,7 +25,14 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from adw_modules.data_types import ADWPhase
-from adw_modules.utils import generate_adw_id, format_duration
+from adw_modules.scheduler import orchestrator_phase, schedule
+from adw_modules.utils import (
+    generate_adw_id,
+    format_duration,
+    ensure_directory,
+    cleanup_dashboard_ports,
+    run_async,
+)
 from adw_plan import run_plan
 from adw_build import run_build
 from adw_validate import run_validate
@@ -32,28 +40,65 @@ from adw_review import run_review
 from adw_release import run_release
 
 
+async def move_spec_to_done(state) -> None:
+    """Move the spec file from specs/todo/ to specs/done/ once it has been reviewed."""
+    if not state.spec:
+        return
+    spec_path = Path(state.spec)
+    if "specs/todo/" not in spec_path.as_posix():
+        return
+    new_spec_path = ensure_directory(Path("specs/done")) / spec_path.name
+    try:
+        await asyncio.to_thread(os.replace, spec_path, new_spec_path)
+    except FileNotFoundError:
+        return
+    state.set_spec_file(str(new_spec_path))
+    print(f"\n[ORCHESTRATOR] Moved spec: {spec_path.name} -> specs/done/")
+
+
 async def run_plan_build_validate_review_release(
-    task_description: str, skip_pypi: bool = False
+    task_description: str, skip_pypi: bool = False, parallel_phases: bool = False
 ) -> bool:
     """Execute the complete 5-phase workflow.
 
     Args:
         task_description: What to implement
         skip_pypi: If True, skip PyPI publish in release phase
+        parallel_phases: If True, run VALIDATE and REVIEW concurrently
 
     Returns:
         True if all phases successful
     """
+    # Orchestrator bookkeeping only needed once the dashboard phases start;
+    # overlap it with PLAN and BUILD
+    prep = asyncio.gather(
+        asyncio.to_thread(ensure_directory, Path("specs/done")),
+        asyncio.to_thread(cleanup_dashboard_ports, 8765),
+    )
+    try:
+        return await _run_workflow(task_description, skip_pypi, parallel_phases, prep)
+    finally:
+        # Retrieve prep's outcome on every exit path, including early failures
+        await asyncio.gather(prep, return_exceptions=True)
+
+
+async def _run_workflow(
+    task_description: str, skip_pypi: bool, parallel_phases: bool, prep: asyncio.Future
+) -> bool:
+    """Run PLAN through RELEASE; prep is the in-flight bookkeeping from the caller."""
     start_time = time.time()
     adw_id = generate_adw_id()
 
-    print("\n" + "=" * 70)
-    print("ADW ORCHESTRATOR: Plan -> Build -> Validate -> Review -> Release")
-    print("=" * 70)
-    print(f"ADW ID: {adw_id}")
-    print(f"Task: {task_description}")
-    print(f"Skip PyPI: {skip_pypi}")
-    print("=" * 70 + "\n")
+    sys.stdout.write("\n" + "\n".join([
+        "=" * 70,
+        "ADW ORCHESTRATOR: Plan -> Build -> Validate -> Review -> Release",
+        "=" * 70,
+        f"ADW ID: {adw_id}",
+        f"Task: {task_description}",
+        f"Skip PyPI: {skip_pypi}",
+        f"Parallel phases: {parallel_phases}",
+        "=" * 70,
+    ]) + "\n\n")
 
     # Phase 1: PLAN
     print("\n" + "-" * 50)
@@ -69,88 +114,68 @@ async def run_plan_build_validate_review_release(
 
     print(f"\n[ORCHESTRATOR] Plan complete. Spec: {state.spec}")
 
-    # Phase 2: BUILD
-    print("\n" + "-" * 50)
-    print("PHASE 2/5: BUILD")
-    print("-" * 50)
-
-    build_success = await run_build(state)
-
-    if not build_success:
-        print("\n[ORCHESTRATOR] Build phase failed. Stopping workflow.")
-        state.mark_failed("Build phase failed")
-        return False
-
-    print("\n[ORCHESTRATOR] Build complete.")
-
-    # Phase 3: VALIDATE
-    print("\n" + "-" * 50)
-    print("PHASE 3/5: VALIDATE")
-    print("-" * 50)
-
-    validate_success = await run_validate(state)
-
-    if not validate_success:
-        print("\n[ORCHESTRATOR] Validate phase failed. Stopping workflow.")
-        print("[ORCHESTRATOR] Fix validation issues before proceeding.")
-        state.mark_failed("Validate phase failed")
-        return False
-
-    print("\n[ORCHESTRATOR] Validate complete.")
-
-    # Move spec file from todo/ to done/ after successful validation
-    if state.spec:
-        spec_path = Path(state.spec)
-        if spec_path.exists() and "specs/todo/" in str(spec_path):
-            done_dir = Path("specs/done")
-            done_dir.mkdir(parents=True, exist_ok=True)
-            new_spec_path = done_dir / spec_path.name
-            spec_path.rename(new_spec_path)
-            state.spec = str(new_spec_path)
-            print(f"\n[ORCHESTRATOR] Moved spec: {spec_path.name} -> specs/done/")
-
-    # Phase 4: REVIEW
-    print("\n" + "-" * 50)
-    print("PHASE 4/5: REVIEW")
-    print("-" * 50)
-
-    review_success = await run_review(state)
-
-    if not review_success:
-        print("\n[ORCHESTRATOR] Review phase failed.")
-        print("[ORCHESTRATOR] Implementation does not match spec requirements.")
-        print("[ORCHESTRATOR] Fix review issues before releasing.")
-        state.mark_failed("Review phase failed")
-        return False
-
-    print("\n[ORCHESTRATOR] Review complete.")
-
-    # Phase 5: RELEASE
-    print("\n" + "-" * 50)
-    print("PHASE 5/5: RELEASE")
-    print("-" * 50)
-
-    release_success = await run_release(state, skip_pypi=skip_pypi)
-
-    if not release_success:
-        print("\n[ORCHESTRATOR] Release phase failed.")
-        state.mark_failed("Release phase failed")
-        return False
+    # ===== PHASES 2-5: declared as a dependency DAG =====
+    # REVIEW normally waits for VALIDATE since both drive the dashboard;
+    # with --parallel-phases it only needs the build. Either way, both
+    # wait for the port cleanup in prep before starting the dashboard.
+    async def validate_after_prep(state) -> bool:
+        await prep
+        return await run_validate(state)
+
+    async def review_after_prep(state) -> bool:
+        await prep
+        return await run_review(state)
+
+    # RELEASE depends on both VALIDATE and REVIEW, so the spec only leaves
+    # specs/todo/ once neither agent can still be reading it there
+    async def move_spec_and_release(state, skip_pypi: bool) -> bool:
+        await move_spec_to_done(state)
+        return await run_release(state, skip_pypi=skip_pypi)
+
+    phases = [
+        orchestrator_phase(ADWPhase.BUILD, 2, 5, set(), run_build,
+                           "Build phase failed. Stopping workflow."),
+        orchestrator_phase(ADWPhase.VALIDATE, 3, 5, {ADWPhase.BUILD}, validate_after_prep,
+                           "Validate phase failed. Stopping workflow.",
+                           "Fix validation issues before proceeding."),
+        orchestrator_phase(ADWPhase.REVIEW, 4, 5,
+                           {ADWPhase.BUILD} if parallel_phases else {ADWPhase.VALIDATE},
+                           review_after_prep, "Review phase failed.",
+                           "Implementation does not match spec requirements.",
+                           "Fix review issues before releasing."),
+        orchestrator_phase(ADWPhase.RELEASE, 5, 5, {ADWPhase.VALIDATE, ADWPhase.REVIEW},
+                           move_spec_and_release, "Release phase failed.",
+                           skip_pypi=skip_pypi),
+    ]
+
+    try:
+        results = await schedule(phases, state)
+    except BaseException as e:
+        state.mark_failed(f"Phase raised: {e}")
+        raise
+
+    for phase in phases:
+        if not results.get(phase.name, False):
+            state.mark_failed(f"{phase.name.value.capitalize()} phase failed")
+            return False
 
     # All phases complete
     state.mark_completed()
     elapsed = time.time() - start_time
 
-    print("\n" + "=" * 70)
-    print("ADW WORKFLOW COMPLETED SUCCESSFULLY")
-    print("=" * 70)
-    print(f"ADW ID: {adw_id}")
-    print(f"Duration: {format_duration(elapsed)}")
-    print(f"Phases completed: {len(state.data.completed_phases)}")
-    print(f"State file: agents/{adw_id}/adw_state.json")
+    summary = [
+        "=" * 70,
+        "ADW WORKFLOW COMPLETED SUCCESSFULLY",
+        "=" * 70,
+        f"ADW ID: {adw_id}",
+        f"Duration: {format_duration(elapsed)}",
+        f"Phases completed: {len(state.data.completed_phases)}",
+        f"State file: agents/{adw_id}/adw_state.json",
+    ]
     if state.spec:
-        print(f"Spec file: {state.spec}")
-    print("=" * 70 + "\n")
+        summary.append(f"Spec file: {state.spec}")
+    summary.append("=" * 70)
+    sys.stdout.write("\n" + "\n".join(summary) + "\n\n")
 
     return True
 
@@ -177,11 +202,17 @@ Examples:
         action="store_true",
         help="Skip PyPI publish, only do git operations",
     )
+    parser.add_argument(
+        "--parallel-phases",
+        action="store_true",
+        help="Run VALIDATE and REVIEW concurrently (both clean up the dashboard "
+             "port when they finish, so avoid if review needs a live dashboard)",
+    )
 
     args = parser.parse_args()
 
-    success = asyncio.run(
-        run_plan_build_validate_review_release(args.task, args.skip_pypi)
+    success = run_async(
+        run_plan_build_validate_review_release(args.task, args.skip_pypi, args.parallel_phases)
     )
 
     if not success:
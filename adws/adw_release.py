@@ -4,6 +4,7 @@
 import asyncio
 import sys
 from pathlib import Path
+from typing import Optional
 
 # Add modules to path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -13,6 +14,51 @@ from adw_modules.state import ADWState
 from adw_modules.agent import run_skill
 
 
+async def _git(*args: str) -> bool:
+    """Run one git command, echoing its output.
+
+    Returns:
+        True if it succeeded, False if it failed or git could not be started
+    """
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "git", *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+    except OSError as e:
+        print(f"[ADW Release] Could not run git: {e}")
+        return False
+    output, _ = await proc.communicate()
+    print(output.decode(errors="replace"))
+    return proc.returncode == 0
+
+
+async def _git_release(state: ADWState) -> Optional[bool]:
+    """Stage, commit and push with git directly (git-only releases).
+
+    The commit subject is the task description, or the spec name for
+    workflows started from a spec.
+
+    Returns:
+        True if committed and pushed, False if committed but the push
+        failed twice, None if nothing was committed (no subject, git
+        unavailable, or staging/committing failed)
+    """
+    subject = state.task or (Path(state.spec).stem if state.spec else "")
+    if not subject:
+        return None
+    message = f"{subject}\n\nADW: {state.adw_id}"
+    if not (await _git("add", "-A") and await _git("commit", "-m", message)):
+        return None
+
+    # The commit exists now, so only the push may be retried
+    if await _git("push"):
+        return True
+    print("[ADW Release] git push failed, retrying once")
+    return await _git("push")
+
+
 async def run_release(state: ADWState, skip_pypi: bool = False) -> bool:
     """Execute the release phase.
 
@@ -29,21 +75,21 @@ async def run_release(state: ADWState, skip_pypi: bool = False) -> bool:
 
     state.start_phase(ADWPhase.RELEASE)
 
-    # Run /omni skill for release
-    release_prompt = f"""Execute /omni to release the changes from this ADW session.
-
-ADW: {state.adw_id}
-Task: {state.task}
-
-{"Skip PyPI publish, only do git operations." if skip_pypi else "Do the full release including PyPI publish if version was bumped."}
-
-Steps:
-1. Stage all changes (git add)
-2. Create commit with descriptive message referencing the task
-3. Push to remote
-4. {"Skip PyPI" if skip_pypi else "Publish to PyPI if appropriate"}
-"""
+    # A git-only release needs no agent: run the git steps directly and fall
+    # back to /omni only if nothing was committed
+    pushed = await _git_release(state) if skip_pypi else None
+    if pushed:
+        state.complete_phase(ADWPhase.RELEASE, success=True)
+        print("[ADW Release] Phase completed successfully (direct git)")
+        return True
+    if pushed is False:
+        error = "Committed locally but git push failed"
+        state.complete_phase(ADWPhase.RELEASE, success=False, error_message=error)
+        print(f"[ADW Release] Phase failed: {error}")
+        return False
 
+    # Run /omni skill for release
+    state.flush()
     success, output, output_file = await run_skill(
         skill_name="omni",
         args="--git-only" if skip_pypi else "",
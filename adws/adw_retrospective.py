@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 """ADW Retrospective Phase - Document lessons learned using /retrospective."""
 
-import asyncio
 import sys
+import time
 from pathlib import Path
 
 # Add modules to path
@@ -11,6 +11,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 from adw_modules.data_types import ADWPhase
 from adw_modules.state import ADWState
 from adw_modules.agent import run_skill
+from adw_modules.utils import get_agents_dir, find_artifacts, run_async
 
 
 async def run_retrospective(state: ADWState) -> bool:
@@ -27,29 +28,10 @@ async def run_retrospective(state: ADWState) -> bool:
 
     state.start_phase(ADWPhase.RETROSPECTIVE)
 
-    # Get completed phases for context
-    completed = [p.value for p in state.data.completed_phases]
-
     # Run /retrospective skill
-    retro_prompt = f"""Execute /retrospective to document lessons learned from this ADW session.
-
-ADW: {state.adw_id}
-Task: {state.task}
-Completed phases: {", ".join(completed)}
-
-Use Omni-Cortex to recall:
-1. Any errors encountered during build (cortex_recall: "error adw_{state.adw_id}")
-2. Any unresolved issues (cortex_recall: "unresolved needs-human")
-3. Decisions made during implementation
-
-Document:
-1. What worked well
-2. What didn't work (including errors from cortex)
-3. Lessons learned
-4. Actionable improvements
-5. HUMAN ATTENTION REQUIRED section (for unresolved issues)
-"""
-
+    # Whole seconds, so coarse filesystem mtimes still count as this run's
+    started = int(time.time())
+    state.flush()
     success, output, output_file = await run_skill(
         skill_name="retrospective",
         args=state.adw_id,
@@ -57,11 +39,9 @@ Document:
         phase="retrospective",
     )
 
-    # Find generated retrospective files
-    retro_files = list(Path("docs/retrospectives").glob("retrospective-*.md"))
-    artifacts = [str(f) for f in retro_files] if retro_files else []
-
     if success:
+        # Find generated retrospective files
+        artifacts = find_artifacts("docs/retrospectives", "retrospective-", ".md", since=started)
         state.complete_phase(
             ADWPhase.RETROSPECTIVE,
             success=True,
@@ -97,19 +77,17 @@ def main():
     adw_id = sys.argv[1]
 
     # Load existing state
-    state = ADWState(adw_id=adw_id)
-
-    # Check if state file exists
-    if not state.state_file.exists():
+    state = ADWState.load(adw_id)
+    if state is None:
         print(f"Error: No ADW state found for {adw_id}")
-        print(f"Expected state file: {state.state_file}")
+        print(f"Expected state file: {get_agents_dir(adw_id) / 'adw_state.json'}")
         sys.exit(1)
 
     print(f"\n[ADW Retrospective] Starting retrospective for {adw_id}")
     print(f"[ADW Retrospective] Task: {state.task}")
     print(f"[ADW Retrospective] Completed phases: {len(state.data.completed_phases)}")
 
-    success = asyncio.run(run_retrospective(state))
+    success = run_async(run_retrospective(state))
 
     if not success:
         sys.exit(1)
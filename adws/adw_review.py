@@ -32,19 +32,7 @@ async def run_review(state: ADWState) -> bool:
     spec_ref = state.spec or "the implementation"
 
     # Run /adw-review skill (more comprehensive than /review)
-    review_prompt = f"""Execute /adw-review to compare the implementation against the spec.
-
-ADW: {state.adw_id}
-Task: {state.task}
-Spec file: {spec_ref}
-
-Review the implementation for:
-1. Spec compliance - all requirements met
-2. Code quality - follows best practices
-3. Completeness - nothing missing
-4. Visual validation - UI matches expectations (if applicable)
-"""
-
+    state.flush()
     success, output, output_file = await run_skill(
         skill_name="adw-review",
         args=spec_ref,
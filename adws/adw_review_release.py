@@ -5,14 +5,17 @@ This orchestrator runs two phases in sequence:
 1. REVIEW: Reviews implementation against spec
 2. RELEASE: Git commit, push, and optional PyPI publish
 
+With --resume, phases this ADW already completed are skipped (and reported),
+so a run that failed at RELEASE can be retried without reviewing again.
+
 Usage:
     uv run adws/adw_review_release.py <adw-id> <spec-file>
     python adws/adw_review_release.py adw_1234567890_abc123 specs/done/feature.md
     python adws/adw_review_release.py adw_1234567890_abc123 specs/done/feature.md --skip-pypi
+    python adws/adw_review_release.py adw_1234567890_abc123 specs/done/feature.md --resume
 """
 
 import argparse
-import asyncio
 import sys
 import time
 from pathlib import Path
@@ -22,31 +25,38 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from adw_modules.data_types import ADWPhase
 from adw_modules.state import ADWState
-from adw_modules.utils import format_duration
+from adw_modules.scheduler import orchestrator_phase, schedule
+from adw_modules.utils import format_duration, run_async
 from adw_review import run_review
 from adw_release import run_release
 
 
-async def run_review_release(adw_id: str, spec_file: str, skip_pypi: bool = False) -> bool:
+async def run_review_release(
+    adw_id: str, spec_file: str, skip_pypi: bool = False, resume: bool = False
+) -> bool:
     """Execute the Review -> Release workflow.
 
     Args:
         adw_id: Existing ADW ID from previous phases
         spec_file: Path to spec file
         skip_pypi: If True, skip PyPI publish
+        resume: If True, skip phases already completed for this ADW
 
     Returns:
         True if all phases successful
     """
     start_time = time.time()
 
-    print("\n" + "=" * 70)
-    print("ADW ORCHESTRATOR: Review -> Release")
-    print("=" * 70)
-    print(f"ADW ID: {adw_id}")
-    print(f"Spec: {spec_file}")
-    print(f"Skip PyPI: {skip_pypi}")
-    print("=" * 70 + "\n")
+    sys.stdout.write("\n" + "\n".join([
+        "=" * 70,
+        "ADW ORCHESTRATOR: Review -> Release",
+        "=" * 70,
+        f"ADW ID: {adw_id}",
+        f"Spec: {spec_file}",
+        f"Skip PyPI: {skip_pypi}",
+        f"Resume: {resume}",
+        "=" * 70,
+    ]) + "\n\n")
 
     # Load existing state (ADWState automatically loads from file if it exists)
     state = ADWState(adw_id=adw_id, task_description=f"Review and release: {spec_file}")
@@ -55,47 +65,43 @@ async def run_review_release(adw_id: str, spec_file: str, skip_pypi: bool = Fals
     if spec_file:
         state.set_spec_file(spec_file)
 
-    # Phase 1: REVIEW
-    print("\n" + "-" * 50)
-    print("PHASE 1/2: REVIEW")
-    print("-" * 50)
-
-    review_success = await run_review(state)
-
-    if not review_success:
-        print("\n[ORCHESTRATOR] Review phase failed.")
-        print("[ORCHESTRATOR] Fix issues before releasing.")
-        state.mark_failed("Review phase failed")
-        return False
-
-    print("\n[ORCHESTRATOR] Review complete.")
+    phases = [
+        orchestrator_phase(ADWPhase.REVIEW, 1, 2, set(), run_review,
+                           "Review phase failed.", "Fix issues before releasing."),
+        orchestrator_phase(ADWPhase.RELEASE, 2, 2, {ADWPhase.REVIEW}, run_release,
+                           "Release phase failed.", skip_pypi=skip_pypi),
+    ]
 
-    # Phase 2: RELEASE
-    print("\n" + "-" * 50)
-    print("PHASE 2/2: RELEASE")
-    print("-" * 50)
+    if resume:
+        done = [p for p in phases if state.is_phase_completed(p.name)]
+        for phase in done:
+            print(f"[ORCHESTRATOR] {phase.name.value.upper()} already completed, skipping.")
+        phases = [p for p in phases if p not in done]
 
-    release_success = await run_release(state, skip_pypi=skip_pypi)
+    results = await schedule(phases, state)
 
-    if not release_success:
-        print("\n[ORCHESTRATOR] Release phase failed.")
-        state.mark_failed("Release phase failed")
-        return False
+    for phase in phases:
+        if not results.get(phase.name, False):
+            state.mark_failed(f"{phase.name.value.capitalize()} phase failed")
+            return False
 
     # All phases complete
     state.mark_completed()
     elapsed = time.time() - start_time
 
-    print("\n" + "=" * 70)
-    print("ADW WORKFLOW COMPLETED SUCCESSFULLY")
-    print("=" * 70)
-    print(f"ADW ID: {adw_id}")
-    print(f"Duration: {format_duration(elapsed)}")
-    print(f"Phases completed: {len(state.data.completed_phases)}")
-    print(f"State file: agents/{adw_id}/adw_state.json")
+    summary = [
+        "=" * 70,
+        "ADW WORKFLOW COMPLETED SUCCESSFULLY",
+        "=" * 70,
+        f"ADW ID: {adw_id}",
+        f"Duration: {format_duration(elapsed)}",
+        f"Phases completed: {len(state.data.completed_phases)}",
+        f"State file: agents/{adw_id}/adw_state.json",
+    ]
     if state.spec:
-        print(f"Spec file: {state.spec}")
-    print("=" * 70 + "\n")
+        summary.append(f"Spec file: {state.spec}")
+    summary.append("=" * 70)
+    sys.stdout.write("\n" + "\n".join(summary) + "\n\n")
 
     return True
 
@@ -109,6 +115,7 @@ def main():
 Examples:
   uv run adws/adw_review_release.py adw_1234567890_abc123 specs/done/feature.md
   python adws/adw_review_release.py adw_1234567890_abc123 specs/done/feature.md --skip-pypi
+  python adws/adw_review_release.py adw_1234567890_abc123 specs/done/feature.md --resume
         """,
     )
     parser.add_argument("adw_id", help="ADW ID from previous phases")
@@ -118,10 +125,17 @@ Examples:
         action="store_true",
         help="Skip PyPI publish, only do git operations",
     )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip phases this ADW already completed (e.g. retry only RELEASE)",
+    )
 
     args = parser.parse_args()
 
-    success = asyncio.run(run_review_release(args.adw_id, args.spec_file, args.skip_pypi))
+    success = run_async(
+        run_review_release(args.adw_id, args.spec_file, args.skip_pypi, args.resume)
+    )
 
     if not success:
         sys.exit(1)
@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 """ADW Security Phase - Security audit using /security."""
 
-import asyncio
 import sys
+import time
 from pathlib import Path
 
 # Add modules to path
@@ -11,7 +11,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 from adw_modules.data_types import ADWPhase
 from adw_modules.state import ADWState
 from adw_modules.agent import run_skill
-from adw_modules.utils import get_phase_dir
+from adw_modules.utils import get_phase_dir, get_agents_dir, find_artifacts, run_async
 
 
 async def run_security(state: ADWState) -> bool:
@@ -44,6 +44,9 @@ Execute the /security skill to:
 Save the audit report to docs/security/ with sequential numbering.
 """
 
+    # Whole seconds, so coarse filesystem mtimes still count as this run's
+    started = int(time.time())
+    state.flush()
     success, output, output_file = await run_skill(
         skill_name="security",
         args=security_prompt,
@@ -51,11 +54,9 @@ Save the audit report to docs/security/ with sequential numbering.
         phase="security",
     )
 
-    # Find the generated security audit file
-    audit_files = list(Path("docs/security").glob("security-audit-*.md"))
-    artifacts = [str(f) for f in audit_files] if audit_files else []
-
     if success:
+        # Find the generated security audit file
+        artifacts = find_artifacts("docs/security", "security-audit-", ".md", since=started)
         state.complete_phase(
             ADWPhase.SECURITY,
             success=True,
@@ -97,19 +98,17 @@ def main():
     adw_id = sys.argv[1]
 
     # Load existing state
-    state = ADWState(adw_id=adw_id)
-
-    # Check if state file exists
-    if not state.state_file.exists():
+    state = ADWState.load(adw_id)
+    if state is None:
         print(f"Error: No ADW state found for {adw_id}")
-        print(f"Expected state file: {state.state_file}")
+        print(f"Expected state file: {get_agents_dir(adw_id) / 'adw_state.json'}")
         sys.exit(1)
 
     print(f"\n[ADW Security] Starting security audit for {adw_id}")
     print(f"[ADW Security] Task: {state.task}")
     print(f"[ADW Security] Completed phases: {len(state.data.completed_phases)}")
 
-    success = asyncio.run(run_security(state))
+    success = run_async(run_security(state))
 
     if not success:
         sys.exit(1)
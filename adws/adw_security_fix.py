@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 """ADW Security Fix Phase - Fix security issues using /security-fix."""
 
-import asyncio
 import sys
 from pathlib import Path
 
@@ -11,6 +10,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 from adw_modules.data_types import ADWPhase
 from adw_modules.state import ADWState
 from adw_modules.agent import run_skill, track_error, MAX_RETRIES
+from adw_modules.utils import get_agents_dir, run_async
 
 
 async def run_security_fix(state: ADWState) -> bool:
@@ -44,6 +44,7 @@ For MEDIUM issues, fix if straightforward.
 Document any issues that cannot be fixed automatically.
 """
 
+    state.flush()
     success, output, output_file = await run_skill(
         skill_name="security-fix",
         args=fix_prompt,
@@ -96,19 +97,17 @@ def main():
     adw_id = sys.argv[1]
 
     # Load existing state
-    state = ADWState(adw_id=adw_id)
-
-    # Check if state file exists
-    if not state.state_file.exists():
+    state = ADWState.load(adw_id)
+    if state is None:
         print(f"Error: No ADW state found for {adw_id}")
-        print(f"Expected state file: {state.state_file}")
+        print(f"Expected state file: {get_agents_dir(adw_id) / 'adw_state.json'}")
         sys.exit(1)
 
     print(f"\n[ADW Security Fix] Starting for {adw_id}")
     print(f"[ADW Security Fix] Task: {state.task}")
     print(f"[ADW Security Fix] Completed phases: {len(state.data.completed_phases)}")
 
-    success = asyncio.run(run_security_fix(state))
+    success = run_async(run_security_fix(state))
 
     if not success:
         sys.exit(1)
@@ -11,7 +11,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 from adw_modules.data_types import ADWPhase
 from adw_modules.state import ADWState
 from adw_modules.agent import run_skill
-from adw_modules.utils import get_phase_dir, cleanup_dashboard_ports
+from adw_modules.utils import get_phase_dir, ensure_directory, find_artifacts, cleanup_dashboard_ports
 
 
 async def run_validate(state: ADWState) -> bool:
@@ -32,8 +32,7 @@ async def run_validate(state: ADWState) -> bool:
     state.start_phase(ADWPhase.VALIDATE)
 
     # Prepare screenshots directory
-    screenshots_dir = get_phase_dir(state.adw_id, "validate") / "screenshots"
-    screenshots_dir.mkdir(exist_ok=True)
+    screenshots_dir = ensure_directory(get_phase_dir(state.adw_id, "validate") / "screenshots")
 
     # Run /validate skill
     validate_prompt = f"""Validate the implementation for ADW: {state.adw_id}
@@ -50,6 +49,7 @@ Save screenshots to: {screenshots_dir}
 
 Report any issues found."""
 
+    state.flush()
     success, output, output_file = await run_skill(
         skill_name="validate",
         args=validate_prompt,
@@ -58,7 +58,7 @@ Report any issues found."""
     )
 
     # Collect any screenshots as artifacts
-    artifacts = [str(p) for p in screenshots_dir.glob("*.png")]
+    artifacts = find_artifacts(screenshots_dir, suffix=".png")
 
     if success:
         state.complete_phase(
@@ -1,6 +1,7 @@
 """Chat service for natural language queries about memories using Gemini Flash."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, AsyncGenerator, Any
 
@@ -31,8 +32,13 @@ def get_client():
     return _client
 
 
+@lru_cache(maxsize=1)
 def is_available() -> bool:
-    """Check if the chat service is available."""
+    """Check if the chat service is available.
+
+    Cached: the API key and installed packages don't change at runtime, and
+    a failed import would otherwise search sys.path on every request.
+    """
     if not _api_key:
         return False
     try:
@@ -97,9 +103,9 @@ Remember: The user has enabled "Write in My Style" mode. Your response should so
 """
 
 
-def _build_prompt(question: str, context_str: str, style_context: Optional[str] = None) -> str:
-    """Build the prompt for the AI model with injection protection."""
-    system_instruction = """You are a helpful assistant that answers questions about stored memories and knowledge.
+# Static instructions for memory Q&A, sent as Gemini's system instruction so
+# the per-request prompt only carries the memories and the question
+_CHAT_SYSTEM_INSTRUCTION = """You are a helpful assistant that answers questions about stored memories and knowledge.
 
 The user has a collection of memories that capture decisions, solutions, insights, errors, preferences, and other learnings from their work.
 
@@ -110,19 +116,29 @@ Instructions:
 2. If the memories don't contain relevant information, say so
 3. Reference specific memories when appropriate using [[Memory N]] format (e.g., "According to [[Memory 1]]...")
 4. Be concise but thorough
-5. If the question is asking for a recommendation or decision, synthesize from multiple memories if possible
+5. If the question is asking for a recommendation or decision, synthesize from multiple memories if possible"""
+
 
-Answer:"""
+def _build_prompt(
+    question: str, context_str: str, style_context: Optional[str] = None
+) -> tuple[str, str]:
+    """Build the system instruction and prompt for the AI model with injection protection.
+
+    Returns:
+        Tuple of (system_instruction, prompt)
+    """
+    system_instruction = _CHAT_SYSTEM_INSTRUCTION
 
     # Add style context if provided
     if style_context:
         system_instruction = f"{system_instruction}\n\n{style_context}"
 
-    return build_safe_prompt(
-        system_instruction=system_instruction,
+    prompt = build_safe_prompt(
+        system_instruction="Answer the user's question using these memories.",
         user_data={"memories": context_str},
         user_question=question
     )
+    return system_instruction, prompt
 
 
 def _get_memories_and_sources(db_path: str, question: str, max_memories: int) -> tuple[str, list[dict]]:
@@ -143,27 +159,29 @@ def _get_memories_and_sources(db_path: str, question: str, max_memories: int) ->
     if not memories:
         return "", []
 
-    # Build context from memories
-    memory_context = []
+    # Build context from memories: one buffer, separators included, joined once
+    buf = []
     sources = []
     for i, mem in enumerate(memories, 1):
-        memory_context.append(f"""
+        content = mem.content
+        buf.append(f"""
 Memory {i}:
 - Type: {mem.memory_type}
-- Content: {mem.content}
+- Content: {content}
 - Context: {mem.context or 'N/A'}
 - Tags: {', '.join(mem.tags) if mem.tags else 'N/A'}
 - Status: {mem.status}
 - Importance: {mem.importance_score}/100
 """)
+        buf.append("\n---\n")
         sources.append({
             "id": mem.id,
             "type": mem.memory_type,
-            "content_preview": mem.content[:100] + "..." if len(mem.content) > 100 else mem.content,
+            "content_preview": content[:100] + "..." if len(content) > 100 else content,
             "tags": mem.tags,
         })
 
-    context_str = "\n---\n".join(memory_context)
+    context_str = "".join(buf[:-1])
     return context_str, sources
 
 
@@ -227,13 +245,14 @@ async def stream_ask_about_memories(
         style_prompt = build_style_context_prompt(style_context)
 
     # Build and stream the response
-    prompt = _build_prompt(question, context_str, style_prompt)
+    system_instruction, prompt = _build_prompt(question, context_str, style_prompt)
 
     try:
         # Use streaming with the new google.genai client
         response = client.models.generate_content_stream(
             model="gemini-2.0-flash",
             contents=prompt,
+            config={"system_instruction": system_instruction},
         )
 
         for chunk in response:
@@ -373,12 +392,13 @@ async def ask_about_memories(
     if style_context:
         style_prompt = build_style_context_prompt(style_context)
 
-    prompt = _build_prompt(question, context_str, style_prompt)
+    system_instruction, prompt = _build_prompt(question, context_str, style_prompt)
 
     try:
         response = client.models.generate_content(
             model="gemini-2.0-flash",
             contents=prompt,
+            config={"system_instruction": system_instruction},
         )
         answer = response.text
     except Exception as e:
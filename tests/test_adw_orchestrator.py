@@ -0,0 +1,80 @@
+"""Tests for phase ordering in the ADW orchestrators."""
+
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("claude_agent_sdk")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "adws"))
+
+import adw_plan_build_validate_review_release as pbvrr  # noqa: E402
+
+
+class FakeState:
+    """Just enough of ADWState for the orchestrator."""
+
+    def __init__(self, spec: str):
+        self.adw_id = "adw_test"
+        self.spec = spec
+        self.data = SimpleNamespace(completed_phases=set())
+
+    def set_spec_file(self, spec: str) -> None:
+        self.spec = spec
+
+    def mark_failed(self, message: str) -> None:
+        pass
+
+    def mark_completed(self) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_spec_moves_after_validate_and_review(tmp_path, monkeypatch):
+    """With --parallel-phases, the spec stays in specs/todo/ until REVIEW ends."""
+    monkeypatch.chdir(tmp_path)
+    spec = Path("specs/todo/feature.md")
+    spec.parent.mkdir(parents=True)
+    spec.write_text("# Feature")
+    state = FakeState(spec.as_posix())
+    events = []
+
+    async def fake_plan(task, adw_id):
+        return True, state
+
+    def phase(name, delay=0.0):
+        async def run(state, **kwargs):
+            events.append(f"{name} start")
+            await asyncio.sleep(delay)
+            # Agents read the spec at the path recorded in state
+            assert Path(state.spec).exists()
+            events.append(f"{name} end")
+            return True
+        return run
+
+    original_move = pbvrr.move_spec_to_done
+
+    async def recording_move(state):
+        events.append("move spec")
+        await original_move(state)
+
+    monkeypatch.setattr(pbvrr, "run_plan", fake_plan)
+    monkeypatch.setattr(pbvrr, "run_build", phase("build"))
+    monkeypatch.setattr(pbvrr, "run_validate", phase("validate"))
+    monkeypatch.setattr(pbvrr, "run_review", phase("review", delay=0.05))
+    monkeypatch.setattr(pbvrr, "run_release", phase("release"))
+    monkeypatch.setattr(pbvrr, "move_spec_to_done", recording_move)
+    monkeypatch.setattr(pbvrr, "cleanup_dashboard_ports", lambda port: None)
+
+    assert await pbvrr.run_plan_build_validate_review_release(
+        "task", skip_pypi=True, parallel_phases=True
+    )
+
+    assert events.index("move spec") > events.index("validate end")
+    assert events.index("move spec") > events.index("review end")
+    assert events.index("move spec") < events.index("release start")
+    assert state.spec == "specs/done/feature.md"
+    assert Path("specs/done/feature.md").exists()